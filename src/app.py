@@ -3,11 +3,19 @@ from tkinter import filedialog, messagebox, ttk
 import tkinter.font as tkfont
 from pathlib import Path
 from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import webbrowser
 
 from ddd_parser import DddHeader, parse_summary
 from export_html import build_html
-from ui_tabs import build_driver_card_tab, build_summary_tab, build_vehicle_unit_tab
+from ui_tabs import (
+    TREE_ROW_HEIGHT,
+    VirtualTreeview,
+    build_driver_card_tab,
+    build_summary_tab,
+    build_vehicle_unit_tab,
+)
 from ddd_structs import (
     format_card_type,
     format_card_slot,
@@ -18,6 +26,7 @@ from ddd_structs import (
     format_driver_event_type,
     format_event_card_slot,
     format_event_fault_type,
+    format_hex_byte,
     format_holder_name,
     format_nation_numeric,
     format_activity,
@@ -57,6 +66,9 @@ class DddReaderApp(tk.Tk):
 
         self.current_file_path = None
         self.current_summary = None
+        self._parse_executor = ThreadPoolExecutor(max_workers=1)
+        self._parse_future = None
+        self._pending_open = None
         self.file_path = tk.StringVar()
         self.status_text = tk.StringVar(value="No file selected.")
         self.validity_text = tk.StringVar(value="Validity: Not checked.")
@@ -70,12 +82,30 @@ class DddReaderApp(tk.Tk):
         self._activity_header_items_by_day = {}
         self._activity_item_day = {}
         self._current_chart_days = ()
+        self._chart_size = None
+        self._last_canvas_size = None
+        self._chart_resize_job = None
         self._chart_item_info = {}
         self._chart_tooltip = None
         self._chart_tooltip_label = None
         self._chart_tooltip_text = None
         self.strict_validation_var = tk.BooleanVar(value=True)
         self.strict_validation = True
+        self._tab_builders = {}
+        self._tab_keys = {}
+        self._tab_refreshers = {
+            "vu_identification": self._update_identification_tab,
+            "vu_report": self._update_report_view,
+            "vu_technical": self._update_technical_tab,
+            "vu_events": self._update_events_tab,
+            "vu_activities": self._update_activities_tab,
+            "card_identification": self._update_card_identification_tab,
+            "card_events": self._update_card_events_tab,
+            "card_vehicles": self._update_card_vehicles_tab,
+            "card_places": self._update_card_places_tab,
+            "card_conditions": self._update_card_conditions_tab,
+            "card_units": self._update_card_units_tab,
+        }
 
         self._apply_theme()
         self._build_ui()
@@ -83,6 +113,12 @@ class DddReaderApp(tk.Tk):
         self.bind_all("<Control-c>", self._copy_selection)
         self.bind_all("<Control-C>", self._copy_selection)
 
+    def destroy(self) -> None:
+        self._parse_executor.shutdown(wait=False, cancel_futures=True)
+        self._parse_future = None
+        self._pending_open = None
+        super().destroy()
+
     def _apply_theme(self) -> None:
         colors = {
             "bg": "#EEF1F5",
@@ -92,8 +128,8 @@ class DddReaderApp(tk.Tk):
             "accent_dark": "#164EB6",
             "text": "#1F2937",
             "subtext": "#6B7280",
-            "success": "#15803D",
-            "danger": "#B91C1C",
+            "success": "#1B5E20",
+            "danger": "#B71C1C",
         }
         self.colors = colors
         style = ttk.Style(self)
@@ -119,7 +155,7 @@ class DddReaderApp(tk.Tk):
         style.configure("Section.TLabel", background=colors["panel"], foreground=colors["text"], font=heading_font)
         style.configure("Valid.TLabel", background=colors["panel"], foreground=colors["success"])
         style.configure("Invalid.TLabel", background=colors["panel"], foreground=colors["danger"])
-        style.configure("Neutral.TLabel", background=colors["panel"], foreground=colors["text"])
+        style.configure("Neutral.TLabel", background=colors["panel"], foreground="#333333")
         style.configure("Link.TLabel", background=colors["panel"], foreground="#0B63CE", font=link_font)
 
         style.configure(
@@ -155,7 +191,7 @@ class DddReaderApp(tk.Tk):
             background=colors["panel"],
             fieldbackground=colors["panel"],
             foreground=colors["text"],
-            rowheight=24,
+            rowheight=TREE_ROW_HEIGHT,
             bordercolor=colors["border"],
         )
         style.configure(
@@ -178,17 +214,7 @@ class DddReaderApp(tk.Tk):
         return tkfont.nametofont("TkDefaultFont").actual("family")
 
     def _asset_path(self, filename: str) -> Path:
-        base = Path(__file__).resolve().parent
-        candidates = (
-            base.parent / "assets",
-            base / "assets",
-            base,
-        )
-        for candidate in candidates:
-            path = candidate / filename
-            if path.exists():
-                return path
-        return base / filename
+        return _find_asset(filename)
 
     def _build_ui(self) -> None:
         self.main_notebook = ttk.Notebook(self)
@@ -231,7 +257,15 @@ class DddReaderApp(tk.Tk):
             return
 
         text = None
-        if isinstance(widget, ttk.Treeview):
+        if isinstance(widget, VirtualTreeview):
+            lines = []
+            for values in widget.selected_rows():
+                parts = [str(value) for value in values if value != ""]
+                if parts:
+                    lines.append(" | ".join(parts))
+            if lines:
+                text = "\n".join(lines)
+        elif isinstance(widget, ttk.Treeview):
             selection = widget.selection()
             if not selection:
                 return
@@ -280,9 +314,36 @@ class DddReaderApp(tk.Tk):
         if not path:
             messagebox.showwarning("No file selected", "Please choose a .ddd file first.")
             return
+        if self._parse_future is not None:
+            # Only the latest request is opened; the running parse's result is dropped.
+            self._pending_open = path
+            self.status_text.set(f"Opening: {Path(path).name}")
+            return
+        self._start_parse(path)
+
+    def _start_parse(self, path: str) -> None:
+        # Parse off the Tk thread so the window keeps repainting; the views are filled
+        # back on the Tk thread once the summary is ready.
+        self.status_text.set(f"Opening: {Path(path).name}")
+        self._parse_future = self._parse_executor.submit(parse_summary, path)
+        self.after(16, self._poll_parse, path)
+
+    def _poll_parse(self, path: str) -> None:
+        future = self._parse_future
+        if future is None:
+            return
+        if not future.done():
+            self.after(16, self._poll_parse, path)
+            return
+        self._parse_future = None
+        pending = self._pending_open
+        if pending is not None:
+            self._pending_open = None
+            self._start_parse(pending)
+            return
 
         try:
-            summary = parse_summary(path)
+            summary = future.result()
         except (OSError, ValueError) as exc:
             if isinstance(exc, ValueError) and str(exc).lower().startswith("file is empty"):
                 self.validity_text.set("Validity: Invalid — Header (empty)")
@@ -290,33 +351,13 @@ class DddReaderApp(tk.Tk):
                 self.validity_text.set(f"Validity: Invalid — File ({exc})")
             self.validity_label.configure(style="Invalid.TLabel")
             self.file_type_text.set("File type: Unknown")
+            self.status_text.set(f"Selected: {Path(path).name}")
             self.current_file_path = None
             self.current_summary = None
-            self._clear_tree(self.header_tree)
-            self._clear_tree(self.parts_tree)
-            self._clear_tree(self.ident_tree)
-            self._clear_tree(self.overview_tree)
-            self._clear_tree(self.tech_ident_tree)
-            self._clear_tree(self.sensor_tree)
-            self._clear_tree(self.calibration_tree)
-            self._clear_tree(self.company_locks_tree)
-            self._clear_tree(self.control_tree)
-            self._clear_tree(self.faults_tree)
-            self._clear_tree(self.events_tree)
-            self._clear_tree(self.overspeed_tree)
-            self._clear_tree(self.card_app_tree)
-            self._clear_tree(self.card_licence_tree)
-            self._clear_tree(self.card_ident_tree)
-            self._clear_tree(self.card_events_tree)
-            self._clear_tree(self.card_faults_tree)
-            self._clear_tree(self.card_vehicles_tree)
-            self._clear_tree(self.card_places_tree)
-            self._clear_tree(self.card_conditions_tree)
-            self._clear_tree(self.card_units_tree)
-            self._clear_tree(self.activity_header_tree)
-            self._clear_tree(self.activities_tree)
-            self.activity_canvas.delete("all")
-            self.activity_day_combo["values"] = ()
+            self._clear_all_trees()
+            if self._tab_built("vu_activities"):
+                self.activity_canvas.delete("all")
+                self.activity_day_combo.set_values(())
             self.activity_day_var.set("")
             self._activity_days = ()
             self._activity_day_map = {}
@@ -335,12 +376,9 @@ class DddReaderApp(tk.Tk):
 
         self._update_header_view(summary.header)
         self._update_parts_view(summary.parts)
-        self._update_identification_view(summary.vu_identification)
-        self._update_report_view(summary)
-        self._update_technical_view(summary.technical_data)
-        self._update_events_tab(summary)
-        self._update_driver_card_view(summary.driver_card)
-        self._update_activities_tab(summary)
+        for key, refresh in self._tab_refreshers.items():
+            if self._tab_built(key):
+                refresh(summary)
         type_label = self._type_label(summary.header.detected_type)
         self.file_type_text.set(f"File type: {type_label}")
         self.current_file_path = path
@@ -403,9 +441,9 @@ class DddReaderApp(tk.Tk):
             entries.append(("Detected generation", generation_label))
         entries.append(("File size (bytes)", str(header.file_size)))
         if header.service_id is not None:
-            entries.append(("Service ID (SID)", f"0x{header.service_id:02X}"))
+            entries.append(("Service ID (SID)", format_hex_byte(header.service_id)))
         if header.trep is not None:
-            entries.append(("TREP#2", f"0x{header.trep:02X}"))
+            entries.append(("TREP#2", format_hex_byte(header.trep)))
         if header.trep_generation:
             entries.append(("TREP generation", self._generation_label(header.trep_generation)))
         if header.trep_data_type:
@@ -437,7 +475,7 @@ class DddReaderApp(tk.Tk):
             ("Approval number", identification.approval_number.strip()),
             ("Serial number", str(identification.serial_number.serial_number)),
             ("Serial month/year", identification.serial_number.month_year_bcd),
-            ("Serial type", f"0x{identification.serial_number.equipment_type:02X}"),
+            ("Serial type", format_hex_byte(identification.serial_number.equipment_type)),
             ("Manufacturer code", str(identification.serial_number.manufacturer_code)),
             ("Software version", identification.software_identification.version),
             (
@@ -459,12 +497,18 @@ class DddReaderApp(tk.Tk):
         for field, value in entries:
             self.ident_tree.insert("", "end", text=field, values=(value,))
 
+    def _update_identification_tab(self, summary) -> None:
+        self._update_identification_view(summary.vu_identification)
+
     def _update_report_view(self, summary) -> None:
         overview = summary.overview
         self._update_overview_view(overview)
         self._update_company_locks_view(overview.company_locks if overview else ())
         self._update_control_activities_view(overview.control_activities if overview else ())
 
+    def _update_technical_tab(self, summary) -> None:
+        self._update_technical_view(summary.technical_data)
+
     def _update_technical_view(self, technical) -> None:
         self._clear_tree(self.tech_ident_tree)
         self._clear_tree(self.sensor_tree)
@@ -489,7 +533,7 @@ class DddReaderApp(tk.Tk):
                 ("Approval number", ident.approval_number.strip()),
                 ("Serial number", str(ident.serial_number.serial_number)),
                 ("Serial month/year", ident.serial_number.month_year_bcd),
-                ("Serial type", f"0x{ident.serial_number.equipment_type:02X}"),
+                ("Serial type", format_hex_byte(ident.serial_number.equipment_type)),
                 ("Manufacturer code", str(ident.serial_number.manufacturer_code)),
                 ("Software version", ident.software_identification.version),
                 (
@@ -544,17 +588,12 @@ class DddReaderApp(tk.Tk):
         self._update_events_view(summary.events)
         self._update_overspeed_events_view(summary.overspeed_events)
 
-    def _update_driver_card_view(self, driver_card) -> None:
+    def _update_card_identification_tab(self, summary) -> None:
+        driver_card = summary.driver_card
         if driver_card is None:
             self._update_card_application_view(None, None)
             self._update_card_licence_view(None)
             self._update_card_ident_view(None)
-            self._update_card_events_view(())
-            self._update_card_faults_view(())
-            self._update_card_vehicles_view(())
-            self._update_card_places_view(())
-            self._update_card_conditions_view(())
-            self._update_card_units_view(())
             return
 
         self._update_card_application_view(
@@ -563,12 +602,27 @@ class DddReaderApp(tk.Tk):
         )
         self._update_card_licence_view(driver_card.driving_licence)
         self._update_card_ident_view(driver_card.card_identification)
-        self._update_card_events_view(driver_card.events)
-        self._update_card_faults_view(driver_card.faults)
-        self._update_card_vehicles_view(driver_card.vehicles_used)
-        self._update_card_places_view(driver_card.places)
-        self._update_card_conditions_view(driver_card.specific_conditions)
-        self._update_card_units_view(driver_card.vehicle_units)
+
+    def _update_card_events_tab(self, summary) -> None:
+        driver_card = summary.driver_card
+        self._update_card_events_view(driver_card.events if driver_card else ())
+        self._update_card_faults_view(driver_card.faults if driver_card else ())
+
+    def _update_card_vehicles_tab(self, summary) -> None:
+        driver_card = summary.driver_card
+        self._update_card_vehicles_view(driver_card.vehicles_used if driver_card else ())
+
+    def _update_card_places_tab(self, summary) -> None:
+        driver_card = summary.driver_card
+        self._update_card_places_view(driver_card.places if driver_card else ())
+
+    def _update_card_conditions_tab(self, summary) -> None:
+        driver_card = summary.driver_card
+        self._update_card_conditions_view(driver_card.specific_conditions if driver_card else ())
+
+    def _update_card_units_tab(self, summary) -> None:
+        driver_card = summary.driver_card
+        self._update_card_units_view(driver_card.vehicle_units if driver_card else ())
 
     def _update_activities_tab(self, summary) -> None:
         self._set_activity_days(summary.activity_days)
@@ -752,50 +806,46 @@ class DddReaderApp(tk.Tk):
             self.card_ident_tree.insert("", "end", text=field, values=(value,))
 
     def _update_card_events_view(self, events) -> None:
-        self._clear_tree(self.card_events_tree)
         if not events:
-            self.card_events_tree.insert(
-                "", "end", values=("Not detected", "", "", "", "")
-            )
+            self._replace_rows(self.card_events_tree, [("Not detected", "", "", "", "")])
             return
         sorted_events = self._sort_by_time_desc(
             events, lambda item: item.begin_time_raw
         )
-        for event in sorted_events:
-            self.card_events_tree.insert(
-                "",
-                "end",
-                values=(
+        self._replace_rows(
+            self.card_events_tree,
+            [
+                (
                     format_driver_event_type(event.event_type),
                     format_time_real(event.begin_time_raw),
                     format_time_real(event.end_time_raw),
                     format_nation_numeric(event.registration_nation),
                     event.registration_number.registration_number,
-                ),
-            )
+                )
+                for event in sorted_events
+            ],
+        )
 
     def _update_card_faults_view(self, faults) -> None:
-        self._clear_tree(self.card_faults_tree)
         if not faults:
-            self.card_faults_tree.insert(
-                "", "end", values=("Not detected", "", "", "", "")
-            )
+            self._replace_rows(self.card_faults_tree, [("Not detected", "", "", "", "")])
             return
         sorted_faults = self._sort_by_time_desc(
             faults, lambda item: item.begin_time_raw
         )
-        for fault in sorted_faults:
-            self.card_faults_tree.insert(
-                "",
-                "end",
-                values=(
+        self._replace_rows(
+            self.card_faults_tree,
+            [
+                (
                     format_driver_event_type(fault.event_type),
                     format_time_real(fault.begin_time_raw),
                     format_time_real(fault.end_time_raw),
                     format_nation_numeric(fault.registration_nation),
                     fault.registration_number.registration_number,
-                ),
-            )
+                )
+                for fault in sorted_faults
+            ],
+        )
 
     def _update_card_vehicles_view(self, vehicles) -> None:
         self._clear_tree(self.card_vehicles_tree)
@@ -826,21 +876,17 @@ class DddReaderApp(tk.Tk):
             )
 
     def _update_card_places_view(self, places) -> None:
-        self._clear_tree(self.card_places_tree)
         if not places:
-            self.card_places_tree.insert(
-                "", "end", values=("Not detected", "", "", "", "", "", "", "", "")
-            )
+            self.card_places_tree.set_rows([("Not detected", "", "", "", "", "", "", "", "")])
             return
         sorted_places = self._sort_by_time_desc(
             places,
             lambda item: item.time_raw if item.time_raw is not None else item.gps_time_raw,
         )
+        rows = []
         for place in sorted_places:
-            self.card_places_tree.insert(
-                "",
-                "end",
-                values=(
+            rows.append(
+                (
                     format_time_real(place.time_raw),
                     format_nation_numeric(place.country),
                     str(place.region),
@@ -850,8 +896,9 @@ class DddReaderApp(tk.Tk):
                     format_gnss_accuracy(place.accuracy),
                     format_gnss_coordinate(place.latitude_raw),
                     format_gnss_coordinate(place.longitude_raw),
-                ),
+                )
             )
+        self.card_places_tree.set_rows(rows)
 
     def _update_card_conditions_view(self, conditions) -> None:
         self._clear_tree(self.card_conditions_tree)
@@ -910,22 +957,16 @@ class DddReaderApp(tk.Tk):
         self.overspeed_count_var.set(str(control.number_of_overspeed_since))
 
     def _update_faults_view(self, faults) -> None:
-        self._clear_tree(self.faults_tree)
         if not faults:
-            self.faults_tree.insert(
-                "",
-                "end",
-                values=("Not detected", "", "", "", "", "", "", ""),
-            )
+            self.faults_tree.set_rows([("Not detected", "", "", "", "", "", "", "")])
             return
         sorted_faults = self._sort_by_time_desc(
             faults, lambda item: item.begin_time_raw
         )
+        rows = []
         for fault in sorted_faults:
-            self.faults_tree.insert(
-                "",
-                "end",
-                values=(
+            rows.append(
+                (
                     format_event_fault_type(fault.fault_type),
                     str(fault.record_purpose),
                     format_time_real(fault.begin_time_raw),
@@ -934,27 +975,22 @@ class DddReaderApp(tk.Tk):
                     format_event_card_slot(fault.driver_card_end),
                     format_event_card_slot(fault.codriver_card_begin),
                     format_event_card_slot(fault.codriver_card_end),
-                ),
+                )
             )
+        self.faults_tree.set_rows(rows)
 
     def _update_events_view(self, events) -> None:
-        self._clear_tree(self.events_tree)
         if not events:
-            self.events_tree.insert(
-                "",
-                "end",
-                values=("Not detected", "", "", "", "", "", "", "", ""),
-            )
+            self.events_tree.set_rows([("Not detected", "", "", "", "", "", "", "", "")])
             return
         sorted_events = self._sort_by_time_desc(
             events, lambda item: item.begin_time_raw
         )
+        rows = []
         for event in sorted_events:
             similar = "" if event.similar_events is None else str(event.similar_events)
-            self.events_tree.insert(
-                "",
-                "end",
-                values=(
+            rows.append(
+                (
                     format_event_fault_type(event.event_type),
                     str(event.record_purpose),
                     format_time_real(event.begin_time_raw),
@@ -964,21 +1000,18 @@ class DddReaderApp(tk.Tk):
                     format_event_card_slot(event.driver_card_end),
                     format_event_card_slot(event.codriver_card_begin),
                     format_event_card_slot(event.codriver_card_end),
-                ),
+                )
             )
+        self.events_tree.set_rows(rows)
 
     def _update_overspeed_events_view(self, events) -> None:
-        self._clear_tree(self.overspeed_tree)
         if not events:
-            self.overspeed_tree.insert(
-                "",
-                "end",
-                values=("Not detected", "", "", "", "", "", "", "", ""),
-            )
+            self.overspeed_tree.set_rows([("Not detected", "", "", "", "", "", "", "", "")])
             return
         sorted_events = self._sort_by_time_desc(
             events, lambda item: item.begin_time_raw
         )
+        rows = []
         for event in sorted_events:
             card = event.card_number
             if is_card_number_missing(card):
@@ -990,10 +1023,8 @@ class DddReaderApp(tk.Tk):
                 card_number = card.card_number
                 nation = format_nation_numeric(card.issuing_nation)
 
-            self.overspeed_tree.insert(
-                "",
-                "end",
-                values=(
+            rows.append(
+                (
                     format_overspeed_event_type(event.event_type, event.record_purpose),
                     format_time_real(event.begin_time_raw),
                     format_time_real(event.end_time_raw),
@@ -1003,8 +1034,9 @@ class DddReaderApp(tk.Tk):
                     card_type,
                     card_number,
                     nation,
-                ),
+                )
             )
+        self.overspeed_tree.set_rows(rows)
 
     def _update_activity_header_view(self, days) -> None:
         self._clear_tree(self.activity_header_tree)
@@ -1053,23 +1085,17 @@ class DddReaderApp(tk.Tk):
                 first_row = False
 
     def _update_activities_view(self, days) -> None:
-        self._clear_tree(self.activities_tree)
         if not days:
-            self.activities_tree.insert(
-                "",
-                "end",
-                values=("Not detected", "", "", "", "", "", "", ""),
-            )
+            self.activities_tree.set_rows([("Not detected", "", "", "", "", "", "", "")])
             return
+        rows = []
         for day in days:
             date_label = format_time_real(day.date_raw)
             odometer = str(day.odometer_midnight) if day.odometer_midnight is not None else ""
             first_row = True
             for segment in day.segments:
-                self.activities_tree.insert(
-                    "",
-                    "end",
-                    values=(
+                rows.append(
+                    (
                         date_label if first_row else "",
                         format_slot(segment.slot),
                         format_minutes(segment.start_minute),
@@ -1078,15 +1104,16 @@ class DddReaderApp(tk.Tk):
                         format_card_status(segment.card_status),
                         format_driving_status(segment.driving_status),
                         odometer if first_row else "",
-                    ),
+                    )
                 )
                 first_row = False
+        self.activities_tree.set_rows(rows)
 
     def _set_activity_days(self, days) -> None:
         if not days:
             self._activity_days = ()
             self._activity_day_map = {}
-            self.activity_day_combo["values"] = ()
+            self.activity_day_combo.set_values(())
             self.activity_day_var.set("")
             return
 
@@ -1099,7 +1126,7 @@ class DddReaderApp(tk.Tk):
             labels.append(label)
             self._activity_day_map[label] = day
 
-        self.activity_day_combo["values"] = tuple(labels)
+        self.activity_day_combo.set_values(labels)
         self.activity_day_var.set("")
 
     def _on_day_selected(self, _event) -> None:
@@ -1124,9 +1151,24 @@ class DddReaderApp(tk.Tk):
     def _on_activity_header_selected(self, _event) -> None:
         self._refresh_activity_views()
 
-    def _on_canvas_resize(self, _event) -> None:
-        if self._current_chart_days:
-            self._draw_activity_chart(self._current_chart_days)
+    def _on_canvas_resize(self, event) -> None:
+        size = (event.width, event.height)
+        if size == self._last_canvas_size:
+            return
+        self._last_canvas_size = size
+        # A window drag fires a burst of <Configure> events; repaint once it settles.
+        if self._chart_resize_job is not None:
+            self.after_cancel(self._chart_resize_job)
+        self._chart_resize_job = self.after(30, self._redraw_activity_chart)
+
+    def _redraw_activity_chart(self) -> None:
+        self._chart_resize_job = None
+        if not self._current_chart_days:
+            return
+        canvas = self.activity_canvas
+        if (canvas.winfo_width(), canvas.winfo_height()) == self._chart_size:
+            return
+        self._draw_activity_chart(self._current_chart_days)
 
     def _on_chart_motion(self, event) -> None:
         canvas = self.activity_canvas
@@ -1186,6 +1228,7 @@ class DddReaderApp(tk.Tk):
         canvas = self.activity_canvas
         canvas.delete("all")
         self._chart_item_info = {}
+        self._chart_size = None
         self._hide_chart_tooltip()
         if not days:
             canvas.configure(scrollregion=(0, 0, 0, 0))
@@ -1194,6 +1237,8 @@ class DddReaderApp(tk.Tk):
         width = canvas.winfo_width()
         if width < 50:
             return
+        height = canvas.winfo_height()
+        self._chart_size = (width, height)
 
         margin_left = 70
         margin_right = 20
@@ -1204,7 +1249,7 @@ class DddReaderApp(tk.Tk):
         scale = usable_width / 1440.0
 
         y_offset = 0
-        per_day_height = max(200, int(canvas.winfo_height() * 0.85))
+        per_day_height = max(200, int(height * 0.85))
         for day in days:
             row_height = int(
                 max(
@@ -1284,7 +1329,7 @@ class DddReaderApp(tk.Tk):
             day_height = timeline_top + row_height * 2 + row_gap + day_label_gap + 10
             y_offset += day_height
 
-        total_height = max(canvas.winfo_height(), int(y_offset))
+        total_height = max(height, int(y_offset))
         canvas.configure(scrollregion=(0, 0, width, total_height))
 
     def _get_selected_activity_days(self) -> list:
@@ -1367,26 +1412,68 @@ class DddReaderApp(tk.Tk):
         ttk.Label(frame, text=label).grid(row=0, column=1, sticky="w")
 
     def _sort_by_time_desc(self, items, key):
-        return sorted(
-            items,
-            key=lambda item: (
-                key(item) is None,
-                -(key(item) or 0),
-            ),
-        )
+        if len(items) < 2:
+            return list(items)
 
-    def _enable_tree_multiselect(self) -> None:
+        def sort_key(item):
+            value = key(item)
+            return value is None, -(value or 0)
+
+        return sorted(items, key=sort_key)
+
+    def _enable_tree_multiselect(self, root=None) -> None:
         def walk(widget) -> None:
             for child in widget.winfo_children():
                 if isinstance(child, ttk.Treeview):
                     child.configure(selectmode="extended")
                 walk(child)
 
+        walk(root or self)
+
+    def _register_tab(self, key: str, tab: ttk.Frame, builder) -> None:
+        self._tab_builders[key] = (tab, builder)
+        self._tab_keys[str(tab)] = key
+
+    def _tab_built(self, key: str) -> bool:
+        return key not in self._tab_builders
+
+    def _on_subtab_changed(self, event) -> None:
+        key = self._tab_keys.get(event.widget.select())
+        if key is not None:
+            self._ensure_tab_built(key)
+
+    def _ensure_tab_built(self, key: str) -> None:
+        pending = self._tab_builders.pop(key, None)
+        if pending is None:
+            return
+        tab, builder = pending
+        builder(self, tab)
+        self._enable_tree_multiselect(tab)
+        if self.current_summary is not None:
+            self._tab_refreshers[key](self.current_summary)
+
+    def _clear_all_trees(self) -> None:
+        def walk(widget) -> None:
+            for child in widget.winfo_children():
+                if isinstance(child, ttk.Treeview):
+                    self._clear_tree(child)
+                walk(child)
+
         walk(self)
 
     def _clear_tree(self, tree: ttk.Treeview) -> None:
-        for item in tree.get_children():
-            tree.delete(item)
+        if isinstance(tree, VirtualTreeview):
+            tree.set_rows(())
+            return
+        children = tree.get_children()
+        if children:
+            tree.delete(*children)
+
+    def _replace_rows(self, tree: ttk.Treeview, rows) -> None:
+        self._clear_tree(tree)
+        insert = tree.insert
+        for index, values in enumerate(rows):
+            insert("", "end", iid=str(index), values=values)
 
     def _set_tab_state(self, tab: ttk.Frame, state: str) -> None:
         try:
@@ -1451,6 +1538,21 @@ class DddReaderApp(tk.Tk):
         return ""
 
 
+@lru_cache(maxsize=None)
+def _find_asset(filename: str) -> Path:
+    base = Path(__file__).resolve().parent
+    candidates = (
+        base.parent / "assets",
+        base / "assets",
+        base,
+    )
+    for candidate in candidates:
+        path = candidate / filename
+        if path.exists():
+            return path
+    return base / filename
+
+
 def main() -> None:
     app = DddReaderApp()
     app.mainloop()
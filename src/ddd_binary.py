@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+import struct
+
+U16_BE = struct.Struct(">H")
 
 
 @dataclass
@@ -59,8 +62,7 @@ class ByteReader:
         return self._read_int(3, "big")
 
     def read_fixed_str(self, length: int, encoding: str = "latin-1") -> str:
-        raw = self.read_bytes(length)
-        return raw.rstrip(b"\x00").decode(encoding, errors="replace").strip()
+        return decode_fixed_str(self.read_bytes(length), encoding)
 
     def read_bcd(self, length: int) -> str:
         raw = self.read_bytes(length)
@@ -80,6 +82,10 @@ class ByteReader:
         return int.from_bytes(self.read_bytes(length), endian)
 
 
+def decode_fixed_str(raw: bytes, encoding: str = "latin-1") -> str:
+    return raw.rstrip(b"\x00").decode(encoding, errors="replace").strip()
+
+
 def _bcd_digit(value: int) -> str:
     if 0 <= value <= 9:
         return str(value)
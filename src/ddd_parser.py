@@ -5,7 +5,7 @@ import hashlib
 from pathlib import Path
 from typing import Any
 
-from ddd_binary import ByteReader
+from ddd_binary import U16_BE, ByteReader
 from ddd_structs import (
     ActivityDay,
     CardApplicationIdentification,
@@ -27,13 +27,13 @@ from ddd_structs import (
     OverspeedingEventRecord,
     build_activity_segments,
     parse_name,
-    parse_event_record,
-    parse_fault_record,
+    parse_event_records_bulk,
+    parse_fault_records_bulk,
     parse_activity_change_infos,
     parse_vehicle_registration_number,
     parse_overspeed_control_data,
     parse_overspeed_event_record,
-    parse_vu_card_iw_record,
+    parse_vu_card_iw_records_bulk,
     parse_vu_company_lock,
     parse_vu_control_activity,
     parse_vu_download_activity_data,
@@ -1005,8 +1005,8 @@ def _parse_gen2_records(payload: bytes) -> list[dict]:
     offset = 0
     while offset + 5 <= len(payload):
         record_type = payload[offset]
-        record_size = int.from_bytes(payload[offset + 1:offset + 3], "big")
-        record_count = int.from_bytes(payload[offset + 3:offset + 5], "big")
+        (record_size,) = U16_BE.unpack_from(payload, offset + 1)
+        (record_count,) = U16_BE.unpack_from(payload, offset + 3)
         total = record_size * record_count
         end = offset + 5 + total
         if end > len(payload):
@@ -1208,9 +1208,9 @@ def _parse_card_ef_files(data: bytes) -> tuple[list[dict], bool, bool]:
     offset = 0
     truncated = False
     while offset + 5 <= len(data):
-        file_id = int.from_bytes(data[offset:offset + 2], "big")
+        (file_id,) = U16_BE.unpack_from(data, offset)
         appendix = data[offset + 2]
-        length = int.from_bytes(data[offset + 3:offset + 5], "big")
+        (length,) = U16_BE.unpack_from(data, offset + 3)
         end = offset + 5 + length
         if end > len(data):
             truncated = True
@@ -1658,27 +1658,19 @@ def _parse_events_faults(
                 continue
 
             if record_type == 0x15:
-                offset = 0
-                for _ in range(record_count):
-                    chunk = record_data[offset:offset + record_size]
-                    if len(chunk) < record_size:
-                        break
-                    try:
-                        events.append(parse_event_record(chunk))
-                    except ValueError:
-                        pass
-                    offset += record_size
+                try:
+                    events.extend(
+                        parse_event_records_bulk(record_data, record_count, record_size)
+                    )
+                except ValueError:
+                    pass
             elif record_type == 0x18:
-                offset = 0
-                for _ in range(record_count):
-                    chunk = record_data[offset:offset + record_size]
-                    if len(chunk) < record_size:
-                        break
-                    try:
-                        faults.append(parse_fault_record(chunk))
-                    except ValueError:
-                        pass
-                    offset += record_size
+                try:
+                    faults.extend(
+                        parse_fault_records_bulk(record_data, record_count, record_size)
+                    )
+                except ValueError:
+                    pass
             elif record_type == 0x1A:
                 offset = 0
                 for _ in range(record_count):
@@ -1768,8 +1760,8 @@ def _parse_driver_card_segments(data: bytes) -> dict[int, bytes]:
         return segments
     offset = 6
     while offset + 4 <= len(data):
-        file_id = int.from_bytes(data[offset:offset + 2], "big")
-        length = int.from_bytes(data[offset + 2:offset + 4], "big")
+        (file_id,) = U16_BE.unpack_from(data, offset)
+        (length,) = U16_BE.unpack_from(data, offset + 2)
         if length <= 0:
             break
         end = offset + 4 + length
@@ -2392,13 +2384,9 @@ def _parse_activity_segment(segment: bytes) -> ActivityDay | None:
         elif record_type == 0x01:
             changes = parse_activity_change_infos(record_data)
         elif record_type == 0x0D:
-            offset = 0
-            for _ in range(record_count):
-                chunk = record_data[offset:offset + record_size]
-                if len(chunk) < record_size:
-                    break
-                card_iw_records.append(parse_vu_card_iw_record(chunk))
-                offset += record_size
+            card_iw_records.extend(
+                parse_vu_card_iw_records_bulk(record_data, record_count, record_size)
+            )
 
     if date_raw is None or not changes:
         return None
@@ -2,8 +2,13 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
+import struct
+import sys
+from types import MappingProxyType
+from typing import Callable
 
-from ddd_binary import ByteReader
+from ddd_binary import U16_BE, ByteReader, decode_fixed_str
 
 
 @dataclass(frozen=True)
@@ -548,58 +553,63 @@ def parse_vu_control_activity(reader: ByteReader) -> VuControlActivity:
     )
 
 
+def parse_event_records_bulk(
+    blob: bytes, count: int, stride: int
+) -> tuple[EventRecord, ...]:
+    layout = _event_fault_struct(stride, with_similar=stride > _EVENT_FAULT_SIZE)
+    records = []
+    for row in layout.iter_unpack(_record_view(blob, count, stride)):
+        begin_raw, begin_iso = _normalize_time_real(row[2])
+        end_raw, end_iso = _normalize_time_real(row[3])
+        records.append(
+            EventRecord(
+                event_type=row[0],
+                record_purpose=row[1],
+                begin_time_raw=begin_raw,
+                begin_time_iso=begin_iso,
+                end_time_raw=end_raw,
+                end_time_iso=end_iso,
+                driver_card_begin=_unpack_full_card_number(row, 4),
+                driver_card_end=_unpack_full_card_number(row, 8),
+                codriver_card_begin=_unpack_full_card_number(row, 12),
+                codriver_card_end=_unpack_full_card_number(row, 16),
+                similar_events=row[20] if len(row) > 20 else None,
+            )
+        )
+    return tuple(records)
+
+
 def parse_event_record(data: bytes) -> EventRecord:
-    reader = ByteReader(data)
-    event_type = reader.read_u8()
-    record_purpose = reader.read_u8()
-    begin_raw, begin_iso = _normalize_time_real(reader.read_u32_be())
-    end_raw, end_iso = _normalize_time_real(reader.read_u32_be())
-    driver_begin = parse_full_card_number_gen2(reader)
-    driver_end = parse_full_card_number_gen2(reader)
-    codriver_begin = parse_full_card_number_gen2(reader)
-    codriver_end = parse_full_card_number_gen2(reader)
-    similar_events = reader.read_u8() if reader.remaining() >= 1 else None
-    if reader.remaining() > 0:
-        reader.skip(reader.remaining())
-    return EventRecord(
-        event_type=event_type,
-        record_purpose=record_purpose,
-        begin_time_raw=begin_raw,
-        begin_time_iso=begin_iso,
-        end_time_raw=end_raw,
-        end_time_iso=end_iso,
-        driver_card_begin=driver_begin,
-        driver_card_end=driver_end,
-        codriver_card_begin=codriver_begin,
-        codriver_card_end=codriver_end,
-        similar_events=similar_events,
-    )
+    return parse_event_records_bulk(data, 1, len(data))[0]
+
+
+def parse_fault_records_bulk(
+    blob: bytes, count: int, stride: int
+) -> tuple[FaultRecord, ...]:
+    layout = _event_fault_struct(stride, with_similar=False)
+    records = []
+    for row in layout.iter_unpack(_record_view(blob, count, stride)):
+        begin_raw, begin_iso = _normalize_time_real(row[2])
+        end_raw, end_iso = _normalize_time_real(row[3])
+        records.append(
+            FaultRecord(
+                fault_type=row[0],
+                record_purpose=row[1],
+                begin_time_raw=begin_raw,
+                begin_time_iso=begin_iso,
+                end_time_raw=end_raw,
+                end_time_iso=end_iso,
+                driver_card_begin=_unpack_full_card_number(row, 4),
+                driver_card_end=_unpack_full_card_number(row, 8),
+                codriver_card_begin=_unpack_full_card_number(row, 12),
+                codriver_card_end=_unpack_full_card_number(row, 16),
+            )
+        )
+    return tuple(records)
 
 
 def parse_fault_record(data: bytes) -> FaultRecord:
-    reader = ByteReader(data)
-    fault_type = reader.read_u8()
-    record_purpose = reader.read_u8()
-    begin_raw, begin_iso = _normalize_time_real(reader.read_u32_be())
-    end_raw, end_iso = _normalize_time_real(reader.read_u32_be())
-    driver_begin = parse_full_card_number_gen2(reader)
-    driver_end = parse_full_card_number_gen2(reader)
-    codriver_begin = parse_full_card_number_gen2(reader)
-    codriver_end = parse_full_card_number_gen2(reader)
-    if reader.remaining() > 0:
-        reader.skip(reader.remaining())
-    return FaultRecord(
-        fault_type=fault_type,
-        record_purpose=record_purpose,
-        begin_time_raw=begin_raw,
-        begin_time_iso=begin_iso,
-        end_time_raw=end_raw,
-        end_time_iso=end_iso,
-        driver_card_begin=driver_begin,
-        driver_card_end=driver_end,
-        codriver_card_begin=codriver_begin,
-        codriver_card_end=codriver_end,
-    )
+    return parse_fault_records_bulk(data, 1, len(data))[0]
 
 
 def parse_overspeed_control_data(data: bytes) -> VuOverSpeedingControlData:
@@ -644,53 +654,55 @@ def parse_overspeed_event_record(data: bytes) -> OverspeedingEventRecord:
     )
 
 
+def parse_vu_card_iw_records_bulk(
+    blob: bytes, count: int, stride: int
+) -> tuple[VuCardIWRecord, ...]:
+    layout = _padded_struct(_CARD_IW_FORMAT, stride)
+    records = []
+    for row in layout.iter_unpack(_record_view(blob, count, stride)):
+        card_expiry_raw = row[8]
+        card_insertion_raw = row[9]
+        card_withdrawal_raw = row[12]
+        previous_withdrawal_raw = row[17]
+        withdrawn = not _is_time_real_max(card_withdrawal_raw)
+
+        records.append(
+            VuCardIWRecord(
+                holder_surname=NameValue(code_page=row[0], text=decode_fixed_str(row[1])),
+                holder_first_names=NameValue(code_page=row[2], text=decode_fixed_str(row[3])),
+                card_number=_unpack_full_card_number(row, 4),
+                card_expiry_raw=card_expiry_raw,
+                card_expiry_iso=_time_real_to_iso(card_expiry_raw),
+                card_insertion_time_raw=card_insertion_raw,
+                card_insertion_time_iso=_time_real_to_iso(card_insertion_raw),
+                card_withdrawal_time_raw=card_withdrawal_raw if withdrawn else None,
+                card_withdrawal_time_iso=(
+                    _time_real_to_iso(card_withdrawal_raw) if withdrawn else None
+                ),
+                slot_number=row[11],
+                odometer_insertion=int.from_bytes(row[10], "big"),
+                odometer_withdrawal=int.from_bytes(row[13], "big"),
+                previous_vehicle_nation=row[14],
+                previous_vehicle_reg=VehicleRegistrationNumber(
+                    code_page=row[15],
+                    registration_number=decode_fixed_str(row[16]),
+                ),
+                previous_withdrawal_time_raw=previous_withdrawal_raw,
+                previous_withdrawal_time_iso=_time_real_to_iso(previous_withdrawal_raw),
+            )
+        )
+    return tuple(records)
+
+
 def parse_vu_card_iw_record(data: bytes) -> VuCardIWRecord:
-    reader = ByteReader(data)
-    holder_surname = parse_name(reader)
-    holder_first_names = parse_name(reader)
-    card_number = parse_full_card_number_gen2(reader)
-    card_expiry_raw = reader.read_u32_be()
-    card_insertion_raw = reader.read_u32_be()
-    odometer_insertion = reader.read_u24_be()
-    slot_number = reader.read_u8()
-    card_withdrawal_raw = reader.read_u32_be()
-    odometer_withdrawal = reader.read_u24_be()
-    previous_nation = reader.read_u8()
-    previous_reg = parse_vehicle_registration_number(reader)
-    previous_withdrawal_raw = reader.read_u32_be()
-
-    card_withdrawal_iso = None
-    if not _is_time_real_max(card_withdrawal_raw):
-        card_withdrawal_iso = _time_real_to_iso(card_withdrawal_raw)
-
-    return VuCardIWRecord(
-        holder_surname=holder_surname,
-        holder_first_names=holder_first_names,
-        card_number=card_number,
-        card_expiry_raw=card_expiry_raw,
-        card_expiry_iso=_time_real_to_iso(card_expiry_raw),
-        card_insertion_time_raw=card_insertion_raw,
-        card_insertion_time_iso=_time_real_to_iso(card_insertion_raw),
-        card_withdrawal_time_raw=None
-        if _is_time_real_max(card_withdrawal_raw)
-        else card_withdrawal_raw,
-        card_withdrawal_time_iso=card_withdrawal_iso,
-        slot_number=slot_number,
-        odometer_insertion=odometer_insertion,
-        odometer_withdrawal=odometer_withdrawal,
-        previous_vehicle_nation=previous_nation,
-        previous_vehicle_reg=previous_reg,
-        previous_withdrawal_time_raw=previous_withdrawal_raw,
-        previous_withdrawal_time_iso=_time_real_to_iso(previous_withdrawal_raw),
-    )
+    return parse_vu_card_iw_records_bulk(data, 1, len(data))[0]
 
 
 def parse_activity_change_infos(raw: bytes) -> tuple[ActivityChangeInfo, ...]:
     changes = []
-    for index in range(0, len(raw), 2):
-        if index + 2 > len(raw):
-            break
-        word = int.from_bytes(raw[index:index + 2], "big")
+    unpack_word = U16_BE.unpack_from
+    for index in range(0, len(raw) - 1, 2):
+        (word,) = unpack_word(raw, index)
         changes.append(_decode_activity_change_info(word))
     return tuple(changes)
 
@@ -737,58 +749,48 @@ def time_real_to_iso(value: int | None) -> str | None:
     return _time_real_to_iso(value)
 
 
+def format_hex_byte(value: int) -> str:
+    if 0 <= value <= 0xFF:
+        return _HEX_BYTE_LABELS[value]
+    return _hex_label(value)
+
+
 def format_card_type(card_type: int) -> str:
-    labels = {
-        0: "Reserved",
-        1: "Driver Card",
-        2: "Workshop Card",
-        3: "Control Card",
-        4: "Company Card",
-        5: "Manufacturing Card",
-        6: "Vehicle Unit",
-        7: "Motion Sensor",
-    }
-    return labels.get(card_type, f"Unknown ({card_type})")
+    if 0 <= card_type <= 0xFF:
+        return _CARD_TYPE_LABELS[card_type]
+    return _unknown_label(card_type)
 
 
 def format_nation_numeric(nation: int) -> str:
-    return _NATION_NUMERIC_TO_ALPHA.get(nation, f"0x{nation:02X}")
+    if 0 <= nation <= 0xFF:
+        return _NATION_ALPHA[nation]
+    return _hex_label(nation)
 
 
 def format_card_generation(value: int | None) -> str:
-    if value is None or value == 0:
+    if value is None:
         return ""
-    if value == 1:
-        return "First Generation"
-    if value == 2:
-        return "Second Generation"
+    if 0 <= value <= 0xFF:
+        return _CARD_GENERATION_LABELS[value]
     return str(value)
 
 
 def format_vu_calibration_purpose(value: int) -> str:
-    labels = {
-        1: "Activation",
-        2: "First installation",
-    }
-    return labels.get(value, f"Purpose {value}")
+    if 0 <= value <= 0xFF:
+        return _CALIBRATION_PURPOSE_LABELS[value]
+    return _purpose_label(value)
 
 
 def format_specific_condition_type(condition_type: int) -> str:
-    labels = {
-        1: "Out Of Scope End",
-        2: "Out Of Scope Begin",
-        3: "Ferry/Train Crossing Begin",
-        4: "Ferry/Train Crossing End",
-    }
-    return labels.get(condition_type, f"Unknown ({condition_type})")
+    if 0 <= condition_type <= 0xFF:
+        return _SPECIFIC_CONDITION_LABELS[condition_type]
+    return _unknown_label(condition_type)
 
 
 def format_place_entry_type(entry_type: int) -> str:
-    labels = {
-        0: "Begin",
-        1: "End",
-    }
-    return labels.get(entry_type, f"Type {entry_type}")
+    if 0 <= entry_type <= 0xFF:
+        return _PLACE_ENTRY_LABELS[entry_type]
+    return _type_label(entry_type)
 
 
 def format_gnss_accuracy(accuracy: int | None) -> str:
@@ -807,35 +809,15 @@ def format_gnss_coordinate(value: int | None) -> str:
 
 
 def format_driver_event_type(event_type: int) -> str:
-    labels = {
-        6: "Last Card Session Not Correctly Closed",
-        8: "Power Supply Interruption",
-        33: "SensorAuthenticationFailure",
-    }
-    if event_type in labels:
-        return labels[event_type]
-    return f"Type {event_type}"
+    if 0 <= event_type <= 0xFF:
+        return _DRIVER_EVENT_LABELS[event_type]
+    return _type_label(event_type)
 
 
 def format_event_fault_type(event_type: int) -> str:
-    label = _EVENT_FAULT_TYPES.get(event_type)
-    if label:
-        return label
-    if 0x0A <= event_type <= 0x0F:
-        return f"RFU (0x{event_type:02X})"
-    if 0x19 <= event_type <= 0x1F:
-        return f"RFU (0x{event_type:02X})"
-    if 0x26 <= event_type <= 0x2F:
-        return f"RFU (0x{event_type:02X})"
-    if 0x36 <= event_type <= 0x3F:
-        return f"RFU (0x{event_type:02X})"
-    if 0x41 <= event_type <= 0x4F:
-        return f"RFU (0x{event_type:02X})"
-    if 0x50 <= event_type <= 0x7F:
-        return f"RFU (0x{event_type:02X})"
-    if 0x80 <= event_type <= 0xFF:
-        return f"Manufacturer specific (0x{event_type:02X})"
-    return f"Unknown ({event_type})"
+    if 0 <= event_type <= 0xFF:
+        return _EVENT_FAULT_LABELS[event_type]
+    return _unknown_label(event_type)
 
 
 def format_overspeed_event_type(event_type: int, record_purpose: int) -> str:
@@ -883,13 +865,9 @@ def format_control_type(control_type: int) -> str:
 def format_activity(activity: int, card_status: int) -> str:
     if card_status == 1:
         return "Unknown"
-    labels = {
-        0: "Rest",
-        1: "Availability",
-        2: "Work",
-        3: "Driving",
-    }
-    return labels.get(activity, f"Unknown ({activity})")
+    if 0 <= activity <= 0xFF:
+        return _ACTIVITY_LABELS[activity]
+    return _unknown_label(activity)
 
 
 def format_slot(slot: int) -> str:
@@ -907,9 +885,9 @@ def format_odometer(value: int | None) -> str:
 def format_minutes(minutes: int) -> str:
     if minutes < 0:
         return ""
-    hours = minutes // 60
-    mins = minutes % 60
-    return f"{hours}:{mins:02d}"
+    if minutes < len(_MINUTE_LABELS):
+        return _MINUTE_LABELS[minutes]
+    return _minutes_label(minutes)
 
 
 def format_holder_name(surname: NameValue, first_names: NameValue) -> str:
@@ -928,6 +906,7 @@ def format_driving_status(status: int) -> str:
     return "Crew" if status == 1 else "Single"
 
 
+@lru_cache(maxsize=4096)
 def _time_real_to_iso(value: int) -> str | None:
     if value <= 0:
         return None
@@ -941,6 +920,71 @@ def _is_time_real_max(value: int) -> bool:
     return value >= 0xFFFFFFFF
 
 
+def _event_fault_struct(stride: int, with_similar: bool) -> struct.Struct:
+    if with_similar:
+        return _padded_struct(_EVENT_FAULT_FORMAT + "B", stride)
+    return _padded_struct(_EVENT_FAULT_FORMAT, stride)
+
+
+@lru_cache(maxsize=None)
+def _padded_struct(layout: str, stride: int) -> struct.Struct:
+    padding = stride - struct.calcsize(layout)
+    if padding < 0:
+        raise ValueError("Not enough bytes to read.")
+    return struct.Struct(f"{layout}{padding}x")
+
+
+def _record_view(blob: bytes, count: int, stride: int) -> memoryview:
+    count = min(count, len(blob) // stride)
+    return memoryview(blob)[:count * stride]
+
+
+def _unpack_full_card_number(row: tuple, index: int) -> FullCardNumber:
+    return FullCardNumber(
+        card_type=row[index],
+        issuing_nation=row[index + 1],
+        card_number=decode_fixed_str(row[index + 2]),
+        card_generation=row[index + 3],
+    )
+
+
+def _byte_labels(
+    labels: dict[int, str], fallback: Callable[[int], str]
+) -> tuple[str, ...]:
+    # One entry per possible byte value so lookups are a plain tuple index.
+    return tuple(
+        sys.intern(labels[value] if value in labels else fallback(value))
+        for value in range(256)
+    )
+
+
+def _unlisted_event_fault_label(event_type: int) -> str:
+    # Every code missing from _EVENT_FAULT_TYPES below 0x80 is RFU.
+    if event_type >= 0x80:
+        return f"Manufacturer specific (0x{event_type:02X})"
+    return f"RFU (0x{event_type:02X})"
+
+
+def _unknown_label(value: int) -> str:
+    return f"Unknown ({value})"
+
+
+def _hex_label(value: int) -> str:
+    return f"0x{value:02X}"
+
+
+def _type_label(value: int) -> str:
+    return f"Type {value}"
+
+
+def _purpose_label(value: int) -> str:
+    return f"Purpose {value}"
+
+
+def _minutes_label(minutes: int) -> str:
+    return f"{minutes // 60}:{minutes % 60:02d}"
+
+
 def _decode_activity_change_info(value: int) -> ActivityChangeInfo:
     slot = (value >> 15) & 0x1
     driving_status = (value >> 14) & 0x1
@@ -962,103 +1006,192 @@ def _normalize_time_real(value: int) -> tuple[int | None, str | None]:
     return value, _time_real_to_iso(value)
 
 
-_EVENT_FAULT_TYPES = {
-    0x00: "No further details",
-    0x01: "Insertion of a non-valid card",
-    0x02: "Card conflict",
-    0x03: "Time overlap",
-    0x04: "Driving Without Appropriate Card",
-    0x05: "Card Insertion While Driving",
-    0x06: "Last card session not correctly closed",
-    0x07: "Overspeeding",
-    0x08: "Power Supply Interruption",
-    0x09: "Motion Data Error",
-    0x10: "No further details",
-    0x11: "Motion sensor authentication failure",
-    0x12: "Tachograph card authentication failure",
-    0x13: "Unauthorised change of motion sensor",
-    0x14: "Card data input integrity error",
-    0x15: "Stored user data integrity error",
-    0x16: "Internal data transfer error",
-    0x17: "Unauthorised case opening",
-    0x18: "Hardware sabotage",
-    0x20: "No further details",
-    0x21: "Authentication failure",
-    0x22: "Stored data integrity error",
-    0x23: "Internal data transfer error",
-    0x24: "Unauthorised case opening",
-    0x25: "Hardware sabotage",
-    0x30: "No further details",
-    0x31: "VU internal fault",
-    0x32: "Printer fault",
-    0x33: "Display fault",
-    0x34: "Downloading fault",
-    0x35: "Sensor fault",
-    0x40: "No further details",
-}
-
-
-_NATION_NUMERIC_TO_ALPHA = {
-    0x00: "",
-    0x01: "A",
-    0x02: "AL",
-    0x03: "AND",
-    0x04: "ARM",
-    0x05: "AZ",
-    0x06: "B",
-    0x07: "BG",
-    0x08: "BIH",
-    0x09: "BY",
-    0x0A: "CH",
-    0x0B: "CY",
-    0x0C: "CZ",
-    0x0D: "D",
-    0x0E: "DK",
-    0x0F: "E",
-    0x10: "EST",
-    0x11: "F",
-    0x12: "FIN",
-    0x13: "FL",
-    0x14: "FR",
-    0x15: "UK",
-    0x16: "GE",
-    0x17: "GR",
-    0x18: "H",
-    0x19: "HR",
-    0x1A: "I",
-    0x1B: "IRL",
-    0x1C: "IS",
-    0x1D: "KZ",
-    0x1E: "L",
-    0x1F: "LT",
-    0x20: "LV",
-    0x21: "M",
-    0x22: "MC",
-    0x23: "MD",
-    0x24: "MK",
-    0x25: "N",
-    0x26: "NL",
-    0x27: "P",
-    0x28: "PL",
-    0x29: "RO",
-    0x2A: "RSM",
-    0x2B: "RUS",
-    0x2C: "S",
-    0x2D: "SK",
-    0x2E: "SLO",
-    0x2F: "TM",
-    0x30: "TR",
-    0x31: "UA",
-    0x32: "V",
-    0x33: "YU",
-    0x34: "MNE",
-    0x35: "SRB",
-    0x36: "UZ",
-    0x37: "TJ",
-    0xFD: "EC",
-    0xFE: "EUR",
-    0xFF: "WLD",
-}
-
-for _code in range(0x38, 0xFD):
-    _NATION_NUMERIC_TO_ALPHA.setdefault(_code, "RFU")
+# Fixed on-disk layouts (big-endian) for homogeneous VU record arrays.
+_FULL_CARD_NUMBER_FORMAT = "BB16sB"
+_EVENT_FAULT_FORMAT = ">BBII" + _FULL_CARD_NUMBER_FORMAT * 4
+_EVENT_FAULT_SIZE = struct.calcsize(_EVENT_FAULT_FORMAT)
+_CARD_IW_FORMAT = ">B35sB35s" + _FULL_CARD_NUMBER_FORMAT + "II3sBI3sBB13sI"
+
+
+_NO_FURTHER_DETAILS = sys.intern("No further details")
+
+_EVENT_FAULT_TYPES = MappingProxyType(
+    {
+        code: sys.intern(label)
+        for code, label in {
+            0x00: _NO_FURTHER_DETAILS,
+            0x01: "Insertion of a non-valid card",
+            0x02: "Card conflict",
+            0x03: "Time overlap",
+            0x04: "Driving Without Appropriate Card",
+            0x05: "Card Insertion While Driving",
+            0x06: "Last card session not correctly closed",
+            0x07: "Overspeeding",
+            0x08: "Power Supply Interruption",
+            0x09: "Motion Data Error",
+            0x10: _NO_FURTHER_DETAILS,
+            0x11: "Motion sensor authentication failure",
+            0x12: "Tachograph card authentication failure",
+            0x13: "Unauthorised change of motion sensor",
+            0x14: "Card data input integrity error",
+            0x15: "Stored user data integrity error",
+            0x16: "Internal data transfer error",
+            0x17: "Unauthorised case opening",
+            0x18: "Hardware sabotage",
+            0x20: _NO_FURTHER_DETAILS,
+            0x21: "Authentication failure",
+            0x22: "Stored data integrity error",
+            0x23: "Internal data transfer error",
+            0x24: "Unauthorised case opening",
+            0x25: "Hardware sabotage",
+            0x30: _NO_FURTHER_DETAILS,
+            0x31: "VU internal fault",
+            0x32: "Printer fault",
+            0x33: "Display fault",
+            0x34: "Downloading fault",
+            0x35: "Sensor fault",
+            0x40: _NO_FURTHER_DETAILS,
+        }.items()
+    }
+)
+
+_EVENT_FAULT_LABELS = _byte_labels(_EVENT_FAULT_TYPES, _unlisted_event_fault_label)
+
+
+# Compile-time constant (folded into the .pyc), indexed by the nation byte;
+# codes 0x38..0xFC are reserved for future use.
+_NATION_ALPHA = (
+    "",  # 0x00
+    "A",  # 0x01
+    "AL",  # 0x02
+    "AND",  # 0x03
+    "ARM",  # 0x04
+    "AZ",  # 0x05
+    "B",  # 0x06
+    "BG",  # 0x07
+    "BIH",  # 0x08
+    "BY",  # 0x09
+    "CH",  # 0x0A
+    "CY",  # 0x0B
+    "CZ",  # 0x0C
+    "D",  # 0x0D
+    "DK",  # 0x0E
+    "E",  # 0x0F
+    "EST",  # 0x10
+    "F",  # 0x11
+    "FIN",  # 0x12
+    "FL",  # 0x13
+    "FR",  # 0x14
+    "UK",  # 0x15
+    "GE",  # 0x16
+    "GR",  # 0x17
+    "H",  # 0x18
+    "HR",  # 0x19
+    "I",  # 0x1A
+    "IRL",  # 0x1B
+    "IS",  # 0x1C
+    "KZ",  # 0x1D
+    "L",  # 0x1E
+    "LT",  # 0x1F
+    "LV",  # 0x20
+    "M",  # 0x21
+    "MC",  # 0x22
+    "MD",  # 0x23
+    "MK",  # 0x24
+    "N",  # 0x25
+    "NL",  # 0x26
+    "P",  # 0x27
+    "PL",  # 0x28
+    "RO",  # 0x29
+    "RSM",  # 0x2A
+    "RUS",  # 0x2B
+    "S",  # 0x2C
+    "SK",  # 0x2D
+    "SLO",  # 0x2E
+    "TM",  # 0x2F
+    "TR",  # 0x30
+    "UA",  # 0x31
+    "V",  # 0x32
+    "YU",  # 0x33
+    "MNE",  # 0x34
+    "SRB",  # 0x35
+    "UZ",  # 0x36
+    "TJ",  # 0x37
+) + ("RFU",) * (0xFD - 0x38) + (
+    "EC",  # 0xFD
+    "EUR",  # 0xFE
+    "WLD",  # 0xFF
+)
+
+_CARD_TYPE_LABELS = _byte_labels(
+    {
+        0: "Reserved",
+        1: "Driver Card",
+        2: "Workshop Card",
+        3: "Control Card",
+        4: "Company Card",
+        5: "Manufacturing Card",
+        6: "Vehicle Unit",
+        7: "Motion Sensor",
+    },
+    _unknown_label,
+)
+
+_CARD_GENERATION_LABELS = _byte_labels(
+    {
+        0: "",
+        1: "First Generation",
+        2: "Second Generation",
+    },
+    str,
+)
+
+_CALIBRATION_PURPOSE_LABELS = _byte_labels(
+    {
+        1: "Activation",
+        2: "First installation",
+    },
+    _purpose_label,
+)
+
+_SPECIFIC_CONDITION_LABELS = _byte_labels(
+    {
+        1: "Out Of Scope End",
+        2: "Out Of Scope Begin",
+        3: "Ferry/Train Crossing Begin",
+        4: "Ferry/Train Crossing End",
+    },
+    _unknown_label,
+)
+
+_PLACE_ENTRY_LABELS = _byte_labels(
+    {
+        0: "Begin",
+        1: "End",
+    },
+    _type_label,
+)
+
+_DRIVER_EVENT_LABELS = _byte_labels(
+    {
+        6: "Last Card Session Not Correctly Closed",
+        8: "Power Supply Interruption",
+        33: "SensorAuthenticationFailure",
+    },
+    _type_label,
+)
+
+_ACTIVITY_LABELS = _byte_labels(
+    {
+        0: "Rest",
+        1: "Availability",
+        2: "Work",
+        3: "Driving",
+    },
+    _unknown_label,
+)
+
+# ActivityChangeInfo carries an 11-bit minute field, so this covers every decoded value.
+_MINUTE_LABELS = tuple(_minutes_label(minutes) for minutes in range(0x800))
+
+_HEX_BYTE_LABELS = tuple(sys.intern(_hex_label(value)) for value in range(256))
@@ -1,18 +1,253 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
+from itertools import chain
 from pathlib import Path
 import tkinter as tk
 from tkinter import ttk
 
+TREE_ROW_HEIGHT = 24
+
+_LOGO_CACHE: dict[tuple[int, str, float], tk.PhotoImage] = {}
+
+
+class VirtualTreeview(ttk.Treeview):
+    def __init__(self, master=None, **kw) -> None:
+        self._yscrollcommand = kw.pop("yscrollcommand", None)
+        super().__init__(master, **kw)
+        self._rows: list[tuple] = []
+        self._first = 0
+        self._window = (0, 0)
+        self._visible = int(self.cget("height"))
+        self._rows_top = None
+        self._render_job = None
+        # Selection and focus are kept as row indexes so they survive rows
+        # leaving the rendered window.
+        self._selected: set[int] = set()
+        self._anchor = None
+        self.bind("<Configure>", self._on_configure, add="+")
+        self.bind("<<TreeviewSelect>>", self._on_select, add="+")
+        self.bind("<Button-1>", self._on_click)
+        self.bind("<Control-Button-1>", lambda _event: None)
+        self.bind("<Shift-Button-1>", self._on_shift_click)
+        self.bind("<MouseWheel>", self._on_mouse_wheel)
+        # The class bindings for these scroll the Tcl view directly, past the window.
+        self.bind("<Button-4>", lambda _event: self._scroll_event(-3))
+        self.bind("<Button-5>", lambda _event: self._scroll_event(3))
+        self.bind("<Prior>", lambda _event: self._scroll_event(-self._visible))
+        self.bind("<Next>", lambda _event: self._scroll_event(self._visible))
+        self.bind("<Home>", lambda _event: self._scroll_event(-len(self._rows)))
+        self.bind("<End>", lambda _event: self._scroll_event(len(self._rows)))
+        self.bind("<Up>", lambda _event: self._on_edge_key(-1))
+        self.bind("<Down>", lambda _event: self._on_edge_key(1))
+
+    def configure(self, cnf=None, **kw):
+        if "yscrollcommand" in kw:
+            self._yscrollcommand = kw.pop("yscrollcommand")
+            self._update_scrollbar()
+            if cnf is None and not kw:
+                return None
+        return super().configure(cnf, **kw)
+
+    config = configure
+
+    def set_rows(self, rows) -> None:
+        self._rows = list(rows)
+        self._first = 0
+        self._window = (0, 0)
+        self._selected = set()
+        self._anchor = None
+        children = self.get_children()
+        if children:
+            self.delete(*children)
+        self._render()
+
+    def selected_rows(self) -> list[tuple]:
+        rows = self._rows
+        return [rows[index] for index in sorted(self._selected)]
+
+    def yview(self, *args):
+        total = len(self._rows)
+        if not args:
+            if not total:
+                return 0.0, 1.0
+            return self._window[0] / total, self._window[1] / total
+        if args[0] == "moveto":
+            self._first = int(float(args[1]) * total)
+        elif args[0] == "scroll":
+            step = self._visible if args[2].startswith("page") else 1
+            self._first += int(args[1]) * step
+        self._schedule_render()
+        return None
+
+    def yview_moveto(self, fraction) -> None:
+        self.yview("moveto", fraction)
+
+    def yview_scroll(self, number, what) -> None:
+        self.yview("scroll", number, what)
+
+    def _on_configure(self, _event) -> None:
+        self._schedule_render()
+
+    def _fit_rows(self) -> None:
+        # Only rows that fit completely count: Tk's own "see" scrolls the native
+        # view to reveal a partly visible row, and _render keeps that view at 0.
+        height = self.winfo_height()
+        if height <= 1:
+            return
+        if self._rows_top is None:
+            children = self.get_children()
+            bbox = self.bbox(children[0]) if children and self.winfo_ismapped() else ""
+            if not bbox:
+                return
+            # Headings plus top border; the bottom border is taken to match the side one.
+            self._rows_top = bbox[1] + bbox[0]
+        self._visible = max(1, (height - self._rows_top) // TREE_ROW_HEIGHT)
+
+    def _on_mouse_wheel(self, event) -> str:
+        if event.delta:
+            if abs(event.delta) >= 120:
+                steps = -event.delta // 120
+            else:
+                steps = -1 if event.delta > 0 else 1
+            self._scroll_rows(steps * 3)
+        return "break"
+
+    def _on_select(self, _event) -> None:
+        first, last = self._window
+        selected = {index for index in self._selected if not first <= index < last}
+        selected.update(int(item_id[1:]) for item_id in self.selection())
+        self._selected = selected
+        focus = self.focus()
+        if focus:
+            self._anchor = int(focus[1:])
+
+    def _on_click(self, event) -> None:
+        # A plain click on a row replaces the whole selection, rendered or not.
+        if self.identify_row(event.y):
+            self._selected.clear()
+
+    def _on_shift_click(self, event):
+        item_id = self.identify_row(event.y)
+        if not item_id or self._anchor is None or self.focus():
+            # With the anchor row rendered the default range selection is correct.
+            return None
+        index = int(item_id[1:])
+        low, high = sorted((self._anchor, index))
+        self._selected = set(range(low, high + 1))
+        first, last = self._window
+        self.selection_set([f"r{row}" for row in range(max(low, first), min(high + 1, last))])
+        return "break"
+
+    def _on_edge_key(self, step: int) -> None:
+        focus = self.focus()
+        if not focus:
+            return
+        if 0 <= int(focus[1:]) + step < len(self._rows):
+            # The default binding moves the focus and selects only that row.
+            self._selected.clear()
+        children = self.get_children()
+        if focus == children[0 if step < 0 else -1]:
+            # Render now so the default binding can move the focus onto the new row.
+            self._first += step
+            self._render()
+
+    def _scroll_event(self, count: int) -> str:
+        self._scroll_rows(count)
+        return "break"
+
+    def _scroll_rows(self, count: int) -> None:
+        self._first += count
+        self._schedule_render()
+
+    def _schedule_render(self) -> None:
+        # Scrollbar drags and wheel bursts only move the offset; the window is
+        # diffed once the event queue drains.
+        if self._render_job is None:
+            self._render_job = self.after_idle(self._flush_render)
+
+    def _flush_render(self) -> None:
+        self._render_job = None
+        self._render()
+
+    def _render(self) -> None:
+        measured = self._rows_top is not None
+        self._fit_rows()
+        rows = self._rows
+        total = len(rows)
+        first = max(0, min(self._first, total - self._visible))
+        last = min(total, first + self._visible)
+        self._first = first
+        old_first, old_last = self._window
+        if (first, last) != (old_first, old_last):
+            if last <= old_first or first >= old_last:
+                children = self.get_children()
+                if children:
+                    self.delete(*children)
+                inserted = range(first, last)
+                for index in inserted:
+                    self.insert("", "end", iid=f"r{index}", values=rows[index])
+            else:
+                stale = chain(range(old_first, first), range(last, old_last))
+                stale_ids = [f"r{index}" for index in stale]
+                if stale_ids:
+                    self.delete(*stale_ids)
+                above = range(old_first - 1, first - 1, -1)
+                below = range(old_last, last)
+                for index in above:
+                    self.insert("", 0, iid=f"r{index}", values=rows[index])
+                for index in below:
+                    self.insert("", "end", iid=f"r{index}", values=rows[index])
+                inserted = chain(above, below)
+            self._window = (first, last)
+            selected = self._selected
+            reselect = [f"r{index}" for index in inserted if index in selected]
+            if reselect:
+                self.selection_add(reselect)
+            if self._anchor is not None and first <= self._anchor < last and not self.focus():
+                self.focus(f"r{self._anchor}")
+        ttk.Treeview.yview(self, "moveto", 0)
+        if not measured and last > first:
+            # The first rendered row gives the heading height; size the window from it.
+            self._fit_rows()
+            if self._rows_top is not None:
+                self._render()
+                return
+        self._update_scrollbar()
+
+    def _update_scrollbar(self) -> None:
+        if self._yscrollcommand is None:
+            return
+        total = len(self._rows)
+        if not total:
+            self._yscrollcommand(0.0, 1.0)
+            return
+        first, last = self._window
+        self._yscrollcommand(first / total, last / total)
+
+
+class LazyCombobox(ttk.Combobox):
+    def __init__(self, master=None, **kw) -> None:
+        super().__init__(master, postcommand=self._load_values, **kw)
+        self._pending_values = None
+        # The wheel steps through the values without posting the dropdown.
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.bind(sequence, self._load_values, add="+")
+
+    def set_values(self, values) -> None:
+        self._pending_values = tuple(values)
+
+    def _load_values(self, _event=None) -> None:
+        if self._pending_values is not None:
+            self.configure(values=self._pending_values)
+            self._pending_values = None
+
 
 def build_summary_tab(app, parent: ttk.Frame) -> None:
     summary = ttk.Frame(parent, padding=16)
     summary.grid(row=0, column=0, sticky="nsew")
-    parent.columnconfigure(0, weight=1)
-    parent.rowconfigure(0, weight=1)
-    summary.columnconfigure(0, weight=1)
-    summary.rowconfigure(5, weight=1)
-    summary.rowconfigure(7, weight=1)
+    _stretch(parent)
+    _stretch(summary, rows=(5, 7))
 
     header_frame = ttk.Frame(summary, style="Header.TFrame")
     header_frame.grid(row=0, column=0, columnspan=4, sticky="ew")
@@ -48,11 +283,7 @@ def build_summary_tab(app, parent: ttk.Frame) -> None:
     logo_path = app._asset_path("logo.png")
     if logo_path.exists():
         try:
-            logo_image = tk.PhotoImage(file=str(logo_path))
-            scale = max(1, logo_image.width() // 260, logo_image.height() // 90)
-            if scale > 1:
-                logo_image = logo_image.subsample(scale, scale)
-            app.logo_image = logo_image
+            app.logo_image = _load_logo(app, logo_path)
             ttk.Label(header_frame, image=app.logo_image).grid(
                 row=0, column=1, sticky="e"
             )
@@ -67,14 +298,10 @@ def build_summary_tab(app, parent: ttk.Frame) -> None:
                 "<Button-1>",
                 lambda _event: app._open_url("https://github.com/attilakixx/dddPy"),
             )
-        except tk.TclError:
+        except (OSError, tk.TclError):
             app.logo_image = None
 
-    ttk.Label(
-        summary,
-        text="Select a tachograph .ddd file to open:",
-        style="Section.TLabel",
-    ).grid(row=1, column=0, columnspan=4, sticky="w", pady=(10, 0))
+    _add_labels(summary, _SUMMARY_LABELS, style="Section.TLabel", columnspan=4)
 
     path_entry = ttk.Entry(summary, textvariable=app.file_path, state="readonly")
     path_entry.grid(row=2, column=0, sticky="ew", padx=(0, 8), pady=(8, 0))
@@ -93,362 +320,218 @@ def build_summary_tab(app, parent: ttk.Frame) -> None:
         row=3, column=0, columnspan=4, sticky="w", pady=(8, 0)
     )
 
-    ttk.Label(summary, text="Parsed header fields:", style="Section.TLabel").grid(
-        row=4, column=0, columnspan=4, sticky="w", pady=(12, 0)
-    )
+    app.header_tree = _build_tree(summary, _HEADER_TREE, row=5, columnspan=4, pady=(6, 0))
 
-    details_frame = ttk.Frame(summary)
-    details_frame.grid(row=5, column=0, columnspan=4, sticky="nsew", pady=(6, 0))
-    details_frame.columnconfigure(0, weight=1)
-    details_frame.rowconfigure(0, weight=1)
+    app.parts_tree = _build_tree(summary, _PARTS_TREE, row=7, columnspan=4, pady=(6, 0))
 
-    app.header_tree = ttk.Treeview(
-        details_frame, columns=("value",), show="tree headings", height=7
+    # All part status colours in one Tcl round trip.
+    app.tk.eval(
+        "\n".join(
+            f"{app.parts_tree} tag configure {tag} -foreground {colour}"
+            for tag, colour in _PART_STATUS_COLOURS
+        )
     )
-    app.header_tree.heading("#0", text="Field")
-    app.header_tree.heading("value", text="Value")
-    app.header_tree.column("#0", width=200, anchor="w")
-    app.header_tree.column("value", anchor="w")
 
-    scrollbar = ttk.Scrollbar(
-        details_frame, orient="vertical", command=app.header_tree.yview
-    )
-    app.header_tree.configure(yscrollcommand=scrollbar.set)
 
-    app.header_tree.grid(row=0, column=0, sticky="nsew")
-    scrollbar.grid(row=0, column=1, sticky="ns")
-
-    ttk.Label(summary, text="File parts:", style="Section.TLabel").grid(
-        row=6, column=0, columnspan=4, sticky="w", pady=(12, 0)
-    )
-
-    parts_frame = ttk.Frame(summary)
-    parts_frame.grid(row=7, column=0, columnspan=4, sticky="nsew", pady=(6, 0))
-    parts_frame.columnconfigure(0, weight=1)
-    parts_frame.rowconfigure(0, weight=1)
-
-    app.parts_tree = ttk.Treeview(
-        parts_frame, columns=("part", "status", "note"), show="headings", height=6
-    )
-    app.parts_tree.heading("part", text="Part")
-    app.parts_tree.heading("status", text="Status")
-    app.parts_tree.heading("note", text="Note")
-    app.parts_tree.column("part", width=200, anchor="w")
-    app.parts_tree.column("status", width=120, anchor="w")
-    app.parts_tree.column("note", anchor="w")
-
-    parts_scrollbar = ttk.Scrollbar(
-        parts_frame, orient="vertical", command=app.parts_tree.yview
-    )
-    app.parts_tree.configure(yscrollcommand=parts_scrollbar.set)
-
-    app.parts_tree.grid(row=0, column=0, sticky="nsew")
-    parts_scrollbar.grid(row=0, column=1, sticky="ns")
-
-    style = ttk.Style()
-    style.configure("Valid.TLabel", foreground="#1B5E20")
-    style.configure("Invalid.TLabel", foreground="#B71C1C")
-    style.configure("Neutral.TLabel", foreground="#333333")
-    app.parts_tree.tag_configure("valid", foreground="#1B5E20")
-    app.parts_tree.tag_configure("invalid", foreground="#B71C1C")
-    app.parts_tree.tag_configure("missing", foreground="#6B6B6B")
-    app.parts_tree.tag_configure("not_applicable", foreground="#6B6B6B")
+def _load_logo(app, logo_path: Path) -> tk.PhotoImage:
+    # PhotoImages belong to one Tk interpreter, so the cache is keyed by it too.
+    key = (id(app.tk), str(logo_path), logo_path.stat().st_mtime)
+    logo_image = _LOGO_CACHE.get(key)
+    if logo_image is None:
+        logo_image = tk.PhotoImage(file=str(logo_path))
+        scale = max(1, logo_image.width() // 260, logo_image.height() // 90)
+        if scale > 1:
+            logo_image = logo_image.subsample(scale, scale)
+        _LOGO_CACHE[key] = logo_image
+    return logo_image
 
 
 def build_vehicle_unit_tab(app, parent: ttk.Frame) -> None:
     vu_notebook = ttk.Notebook(parent)
     vu_notebook.grid(row=0, column=0, sticky="nsew")
-    parent.columnconfigure(0, weight=1)
-    parent.rowconfigure(0, weight=1)
-
-    ident_tab = ttk.Frame(vu_notebook)
-    report_tab = ttk.Frame(vu_notebook)
-    technical_tab = ttk.Frame(vu_notebook)
-    events_tab = ttk.Frame(vu_notebook)
-    activities_tab = ttk.Frame(vu_notebook)
-    vu_notebook.add(ident_tab, text="Identification")
-    vu_notebook.add(report_tab, text="Report")
-    vu_notebook.add(technical_tab, text="Technical Data")
-    vu_notebook.add(events_tab, text="Events/Faults")
-    vu_notebook.add(activities_tab, text="Activities")
-
-    ident = ttk.Frame(ident_tab, padding=12)
-    ident.grid(row=0, column=0, sticky="nsew")
-    ident_tab.columnconfigure(0, weight=1)
-    ident_tab.rowconfigure(0, weight=1)
-    ident.columnconfigure(0, weight=1)
-    ident.rowconfigure(1, weight=1)
-
-    ttk.Label(ident, text="VU identification (heuristic):").grid(
-        row=0, column=0, sticky="w", pady=(0, 6)
-    )
-
-    ident_frame = ttk.Frame(ident)
-    ident_frame.grid(row=1, column=0, sticky="nsew", pady=(0, 6))
-    ident_frame.columnconfigure(0, weight=1)
-    ident_frame.rowconfigure(0, weight=1)
-
-    app.ident_tree = ttk.Treeview(
-        ident_frame, columns=("value",), show="tree headings", height=7
-    )
-    app.ident_tree.heading("#0", text="Field")
-    app.ident_tree.heading("value", text="Value")
-    app.ident_tree.column("#0", width=220, anchor="w")
-    app.ident_tree.column("value", anchor="w")
-
-    ident_scrollbar = ttk.Scrollbar(
-        ident_frame, orient="vertical", command=app.ident_tree.yview
+    _stretch(parent)
+
+    _add_lazy_tabs(
+        app,
+        vu_notebook,
+        (
+            ("vu_identification", "Identification", _build_vu_identification_tab),
+            ("vu_report", "Report", _build_vu_report_tab),
+            ("vu_technical", "Technical Data", _build_vu_technical_tab),
+            ("vu_events", "Events/Faults", _build_vu_events_tab),
+            ("vu_activities", "Activities", _build_vu_activities_tab),
+        ),
     )
-    app.ident_tree.configure(yscrollcommand=ident_scrollbar.set)
 
-    app.ident_tree.grid(row=0, column=0, sticky="nsew")
-    ident_scrollbar.grid(row=0, column=1, sticky="ns")
 
-    report = ttk.Frame(report_tab, padding=12)
-    report.grid(row=0, column=0, sticky="nsew")
-    report_tab.columnconfigure(0, weight=1)
-    report_tab.rowconfigure(0, weight=1)
-    report.columnconfigure(0, weight=1)
-    report.rowconfigure(1, weight=1)
-    report.rowconfigure(3, weight=1)
-    report.rowconfigure(5, weight=1)
-
-    ttk.Label(report, text="Overview:").grid(
-        row=0, column=0, sticky="w", pady=(0, 6)
+def build_driver_card_tab(app, parent: ttk.Frame) -> None:
+    driver_card = ttk.Notebook(parent)
+    driver_card.grid(row=0, column=0, sticky="nsew")
+    _stretch(parent)
+
+    _add_lazy_tabs(
+        app,
+        driver_card,
+        (
+            ("card_identification", "Identification", _build_card_identification_tab),
+            ("card_events", "Events", _build_card_events_tab),
+            ("card_vehicles", "Vehicles", _build_card_vehicles_tab),
+            ("card_places", "Places", _build_card_places_tab),
+            ("card_conditions", "Conditions", _build_card_conditions_tab),
+            ("card_units", "Vehicle Units", _build_card_units_tab),
+        ),
     )
 
-    overview_frame = ttk.Frame(report)
-    overview_frame.grid(row=1, column=0, sticky="nsew", pady=(0, 12))
-    overview_frame.columnconfigure(0, weight=1)
-    overview_frame.rowconfigure(0, weight=1)
 
-    app.overview_tree = ttk.Treeview(
-        overview_frame, columns=("value",), show="tree headings", height=10
-    )
-    app.overview_tree.heading("#0", text="Field")
-    app.overview_tree.heading("value", text="Value")
-    app.overview_tree.column("#0", width=260, anchor="w")
-    app.overview_tree.column("value", anchor="w")
+class _CoalescedSet:
+    # Collapses the scrollbar updates of one event-loop pass into a single set()
+    # and keeps the scrollbar out of the grid while every row fits.
+    def __init__(self, scrollbar: ttk.Scrollbar) -> None:
+        self._scrollbar = scrollbar
+        self._pending = None
+        self._shown = True
+
+    def __call__(self, first, last) -> None:
+        if self._pending is None:
+            self._scrollbar.after_idle(self._flush)
+        self._pending = (first, last)
+
+    def _flush(self) -> None:
+        pending = self._pending
+        self._pending = None
+        if pending is None:
+            return
+        first, last = pending
+        show = float(first) > 0.0 or float(last) < 1.0
+        if show != self._shown:
+            self._shown = show
+            if show:
+                self._scrollbar.grid()
+            else:
+                self._scrollbar.grid_remove()
+        self._scrollbar.set(first, last)
+
+
+@dataclass(frozen=True)
+class _TreeSpec:
+    columns: tuple[tuple[str, str, int | None], ...]
+    height: int
+    virtual: bool = False
+
+
+def _build_tree(
+    parent, spec: _TreeSpec, row: int, columnspan: int = 1, pady=0
+) -> ttk.Treeview:
+    if columnspan > 1:
+        # The tree shares its columns with other widgets, so it keeps a wrapper frame.
+        frame = ttk.Frame(parent)
+        frame.grid(row=row, column=0, columnspan=columnspan, sticky="nsew", pady=pady)
+        _stretch(frame)
+        row = 0
+        pady = 0
+    else:
+        frame = parent
+
+    column_ids = tuple(column_id for column_id, _text, _width in spec.columns)
+    show = "headings"
+    if column_ids[0] == "#0":
+        column_ids = column_ids[1:]
+        show = "tree headings"
+    tree_class = VirtualTreeview if spec.virtual else ttk.Treeview
+    tree = tree_class(frame, columns=column_ids, show=show, height=spec.height)
+    _setup_columns(tree, spec.columns)
+
+    scrollbar = ttk.Scrollbar(frame, orient="vertical", command=tree.yview)
+    tree.configure(yscrollcommand=_CoalescedSet(scrollbar))
+
+    # Every scrolled tree goes through here, so skip the tkinter option translation.
+    placement = ("-row", row, "-pady", pady)
+    frame.tk.call("grid", "configure", str(tree), "-column", 0, "-sticky", "nsew", *placement)
+    frame.tk.call("grid", "configure", str(scrollbar), "-column", 1, "-sticky", "ns", *placement)
+    return tree
+
+
+def _stretch(widget, columns=0, rows=0) -> None:
+    widget.columnconfigure(columns, weight=1)
+    widget.rowconfigure(rows, weight=1)
+
+
+def _setup_columns(tree: ttk.Treeview, spec) -> None:
+    for column_id, text, width in spec:
+        tree.heading(column_id, text=text)
+        if width is None:
+            tree.column(column_id, anchor="w")
+        else:
+            tree.column(column_id, width=width, anchor="w")
+
+
+def _add_labels(parent, labels, style=None, columnspan: int = 1) -> None:
+    for row, text, pady in labels:
+        ttk.Label(parent, text=text, style=style).grid(
+            row=row, column=0, columnspan=columnspan, sticky="w", pady=pady
+        )
+
+
+def _add_lazy_tabs(app, notebook: ttk.Notebook, tabs) -> None:
+    for key, text, builder in tabs:
+        tab = ttk.Frame(notebook)
+        notebook.add(tab, text=text)
+        app._register_tab(key, tab, builder)
+    notebook.bind("<<NotebookTabChanged>>", app._on_subtab_changed, add="+")
+    app._ensure_tab_built(tabs[0][0])
+
+
+def _build_vu_identification_tab(app, ident_tab: ttk.Frame) -> None:
+    ident = ttk.Frame(ident_tab, padding=12)
+    ident.grid(row=0, column=0, sticky="nsew")
+    _stretch(ident_tab)
+    _stretch(ident, rows=1)
 
-    overview_scrollbar = ttk.Scrollbar(
-        overview_frame, orient="vertical", command=app.overview_tree.yview
-    )
-    app.overview_tree.configure(yscrollcommand=overview_scrollbar.set)
+    _add_labels(ident, _VU_IDENTIFICATION_LABELS)
 
-    app.overview_tree.grid(row=0, column=0, sticky="nsew")
-    overview_scrollbar.grid(row=0, column=1, sticky="ns")
+    app.ident_tree = _build_tree(ident, _IDENT_TREE, row=1, pady=(0, 6))
 
-    ttk.Label(report, text="Company locks:").grid(
-        row=2, column=0, sticky="w", pady=(0, 6)
-    )
 
-    locks_frame = ttk.Frame(report)
-    locks_frame.grid(row=3, column=0, sticky="nsew", pady=(0, 12))
-    locks_frame.columnconfigure(0, weight=1)
-    locks_frame.rowconfigure(0, weight=1)
+def _build_vu_report_tab(app, report_tab: ttk.Frame) -> None:
+    report = ttk.Frame(report_tab, padding=12)
+    report.grid(row=0, column=0, sticky="nsew")
+    _stretch(report_tab)
+    _stretch(report, rows=(1, 3, 5))
 
-    app.company_locks_tree = ttk.Treeview(
-        locks_frame,
-        columns=("start", "end", "name", "address", "card"),
-        show="headings",
-        height=6,
-    )
-    app.company_locks_tree.heading("start", text="Start")
-    app.company_locks_tree.heading("end", text="End")
-    app.company_locks_tree.heading("name", text="Company Name")
-    app.company_locks_tree.heading("address", text="Company Address")
-    app.company_locks_tree.heading("card", text="Card Number")
-    app.company_locks_tree.column("start", width=160, anchor="w")
-    app.company_locks_tree.column("end", width=160, anchor="w")
-    app.company_locks_tree.column("name", width=180, anchor="w")
-    app.company_locks_tree.column("address", width=220, anchor="w")
-    app.company_locks_tree.column("card", width=160, anchor="w")
-
-    locks_scrollbar = ttk.Scrollbar(
-        locks_frame, orient="vertical", command=app.company_locks_tree.yview
-    )
-    app.company_locks_tree.configure(yscrollcommand=locks_scrollbar.set)
+    _add_labels(report, _VU_REPORT_LABELS)
 
-    app.company_locks_tree.grid(row=0, column=0, sticky="nsew")
-    locks_scrollbar.grid(row=0, column=1, sticky="ns")
+    app.overview_tree = _build_tree(report, _OVERVIEW_TREE, row=1, pady=(0, 12))
 
-    ttk.Label(report, text="Control activities:").grid(
-        row=4, column=0, sticky="w", pady=(0, 6)
-    )
+    app.company_locks_tree = _build_tree(report, _COMPANY_LOCKS_TREE, row=3, pady=(0, 12))
 
-    controls_frame = ttk.Frame(report)
-    controls_frame.grid(row=5, column=0, sticky="nsew")
-    controls_frame.columnconfigure(0, weight=1)
-    controls_frame.rowconfigure(0, weight=1)
-
-    app.control_tree = ttk.Treeview(
-        controls_frame,
-        columns=(
-            "type",
-            "time",
-            "card_type",
-            "nation",
-            "card_number",
-            "generation",
-            "begin",
-            "end",
-        ),
-        show="headings",
-        height=7,
-    )
-    app.control_tree.heading("type", text="Type")
-    app.control_tree.heading("time", text="Time")
-    app.control_tree.heading("card_type", text="Card Type")
-    app.control_tree.heading("nation", text="Card Issuing Member State")
-    app.control_tree.heading("card_number", text="Card Number")
-    app.control_tree.heading("generation", text="Card Generation")
-    app.control_tree.heading("begin", text="Begin Period")
-    app.control_tree.heading("end", text="End Period")
-
-    app.control_tree.column("type", width=200, anchor="w")
-    app.control_tree.column("time", width=160, anchor="w")
-    app.control_tree.column("card_type", width=140, anchor="w")
-    app.control_tree.column("nation", width=120, anchor="w")
-    app.control_tree.column("card_number", width=160, anchor="w")
-    app.control_tree.column("generation", width=110, anchor="w")
-    app.control_tree.column("begin", width=160, anchor="w")
-    app.control_tree.column("end", width=160, anchor="w")
-
-    controls_scrollbar = ttk.Scrollbar(
-        controls_frame, orient="vertical", command=app.control_tree.yview
-    )
-    app.control_tree.configure(yscrollcommand=controls_scrollbar.set)
+    app.control_tree = _build_tree(report, _CONTROL_TREE, row=5)
 
-    app.control_tree.grid(row=0, column=0, sticky="nsew")
-    controls_scrollbar.grid(row=0, column=1, sticky="ns")
 
+def _build_vu_technical_tab(app, technical_tab: ttk.Frame) -> None:
     technical = ttk.Frame(technical_tab, padding=12)
     technical.grid(row=0, column=0, sticky="nsew")
-    technical_tab.columnconfigure(0, weight=1)
-    technical_tab.rowconfigure(0, weight=1)
-    technical.columnconfigure(0, weight=1)
-    technical.rowconfigure(1, weight=1)
-    technical.rowconfigure(3, weight=1)
-    technical.rowconfigure(5, weight=1)
-
-    ttk.Label(technical, text="Technical identification:").grid(
-        row=0, column=0, sticky="w", pady=(0, 6)
-    )
-
-    tech_ident_frame = ttk.Frame(technical)
-    tech_ident_frame.grid(row=1, column=0, sticky="nsew", pady=(0, 12))
-    tech_ident_frame.columnconfigure(0, weight=1)
-    tech_ident_frame.rowconfigure(0, weight=1)
-
-    app.tech_ident_tree = ttk.Treeview(
-        tech_ident_frame, columns=("value",), show="tree headings", height=7
-    )
-    app.tech_ident_tree.heading("#0", text="Field")
-    app.tech_ident_tree.heading("value", text="Value")
-    app.tech_ident_tree.column("#0", width=220, anchor="w")
-    app.tech_ident_tree.column("value", anchor="w")
-
-    tech_ident_scrollbar = ttk.Scrollbar(
-        tech_ident_frame, orient="vertical", command=app.tech_ident_tree.yview
-    )
-    app.tech_ident_tree.configure(yscrollcommand=tech_ident_scrollbar.set)
-
-    app.tech_ident_tree.grid(row=0, column=0, sticky="nsew")
-    tech_ident_scrollbar.grid(row=0, column=1, sticky="ns")
-
-    ttk.Label(technical, text="Sensor pairing:").grid(
-        row=2, column=0, sticky="w", pady=(0, 6)
-    )
-
-    sensor_frame = ttk.Frame(technical)
-    sensor_frame.grid(row=3, column=0, sticky="nsew", pady=(0, 12))
-    sensor_frame.columnconfigure(0, weight=1)
-    sensor_frame.rowconfigure(0, weight=1)
+    _stretch(technical_tab)
+    _stretch(technical, rows=(1, 3, 5))
 
-    app.sensor_tree = ttk.Treeview(
-        sensor_frame, columns=("value",), show="tree headings", height=4
-    )
-    app.sensor_tree.heading("#0", text="Field")
-    app.sensor_tree.heading("value", text="Value")
-    app.sensor_tree.column("#0", width=220, anchor="w")
-    app.sensor_tree.column("value", anchor="w")
+    _add_labels(technical, _VU_TECHNICAL_LABELS)
 
-    sensor_scrollbar = ttk.Scrollbar(
-        sensor_frame, orient="vertical", command=app.sensor_tree.yview
-    )
-    app.sensor_tree.configure(yscrollcommand=sensor_scrollbar.set)
+    app.tech_ident_tree = _build_tree(technical, _TECH_IDENT_TREE, row=1, pady=(0, 12))
 
-    app.sensor_tree.grid(row=0, column=0, sticky="nsew")
-    sensor_scrollbar.grid(row=0, column=1, sticky="ns")
+    app.sensor_tree = _build_tree(technical, _SENSOR_TREE, row=3, pady=(0, 12))
 
-    ttk.Label(technical, text="Calibration records:").grid(
-        row=4, column=0, sticky="w", pady=(0, 6)
-    )
+    app.calibration_tree = _build_tree(technical, _CALIBRATION_TREE, row=5)
 
-    calibration_frame = ttk.Frame(technical)
-    calibration_frame.grid(row=5, column=0, sticky="nsew")
-    calibration_frame.columnconfigure(0, weight=1)
-    calibration_frame.rowconfigure(0, weight=1)
-
-    app.calibration_tree = ttk.Treeview(
-        calibration_frame,
-        columns=(
-            "purpose",
-            "workshop",
-            "address",
-            "card",
-            "expiry",
-            "vin",
-            "registration",
-            "vehicle_constant",
-            "recording_constant",
-        ),
-        show="headings",
-        height=7,
-    )
-    app.calibration_tree.heading("purpose", text="Purpose")
-    app.calibration_tree.heading("workshop", text="Workshop Name")
-    app.calibration_tree.heading("address", text="Workshop Address")
-    app.calibration_tree.heading("card", text="Workshop Card")
-    app.calibration_tree.heading("expiry", text="Card Expiry")
-    app.calibration_tree.heading("vin", text="VIN")
-    app.calibration_tree.heading("registration", text="Registration")
-    app.calibration_tree.heading("vehicle_constant", text="Vehicle Constant")
-    app.calibration_tree.heading("recording_constant", text="Recording Constant")
-
-    app.calibration_tree.column("purpose", width=140, anchor="w")
-    app.calibration_tree.column("workshop", width=180, anchor="w")
-    app.calibration_tree.column("address", width=220, anchor="w")
-    app.calibration_tree.column("card", width=180, anchor="w")
-    app.calibration_tree.column("expiry", width=160, anchor="w")
-    app.calibration_tree.column("vin", width=180, anchor="w")
-    app.calibration_tree.column("registration", width=160, anchor="w")
-    app.calibration_tree.column("vehicle_constant", width=130, anchor="w")
-    app.calibration_tree.column("recording_constant", width=150, anchor="w")
-
-    calibration_scrollbar = ttk.Scrollbar(
-        calibration_frame, orient="vertical", command=app.calibration_tree.yview
-    )
-    app.calibration_tree.configure(yscrollcommand=calibration_scrollbar.set)
-
-    app.calibration_tree.grid(row=0, column=0, sticky="nsew")
-    calibration_scrollbar.grid(row=0, column=1, sticky="ns")
 
+def _build_vu_events_tab(app, events_tab: ttk.Frame) -> None:
     events = ttk.Frame(events_tab, padding=12)
     events.grid(row=0, column=0, sticky="nsew")
-    events_tab.columnconfigure(0, weight=1)
-    events_tab.rowconfigure(0, weight=1)
-    events.columnconfigure(0, weight=1)
-    events.rowconfigure(3, weight=1)
-    events.rowconfigure(5, weight=1)
-    events.rowconfigure(7, weight=1)
-
-    ttk.Label(events, text="Overspeed control:").grid(
-        row=0, column=0, sticky="w", pady=(0, 6)
-    )
+    _stretch(events_tab)
+    _stretch(events, rows=(3, 5, 7))
+
+    _add_labels(events, _VU_EVENTS_LABELS)
 
     overspeed_info = ttk.Frame(events)
-    overspeed_info.grid(row=1, column=0, sticky="ew", pady=(0, 12))
+    overspeed_info.grid(row=1, column=0, columnspan=2, sticky="ew", pady=(0, 12))
     overspeed_info.columnconfigure(1, weight=1)
 
     ttk.Label(overspeed_info, text="Last Overspeed Control Time:").grid(
@@ -470,238 +553,31 @@ def build_vehicle_unit_tab(app, parent: ttk.Frame) -> None:
         row=2, column=1, sticky="w"
     )
 
-    ttk.Label(events, text="Fault data:").grid(
-        row=2, column=0, sticky="w", pady=(0, 6)
-    )
+    app.faults_tree = _build_tree(events, _FAULTS_TREE, row=3, pady=(0, 12))
 
-    faults_frame = ttk.Frame(events)
-    faults_frame.grid(row=3, column=0, sticky="nsew", pady=(0, 12))
-    faults_frame.columnconfigure(0, weight=1)
-    faults_frame.rowconfigure(0, weight=1)
-
-    app.faults_tree = ttk.Treeview(
-        faults_frame,
-        columns=(
-            "type",
-            "purpose",
-            "begin",
-            "end",
-            "driver_begin",
-            "driver_end",
-            "codriver_begin",
-            "codriver_end",
-        ),
-        show="headings",
-        height=6,
-    )
-    app.faults_tree.heading("type", text="Fault Type")
-    app.faults_tree.heading("purpose", text="Purpose")
-    app.faults_tree.heading("begin", text="Begin")
-    app.faults_tree.heading("end", text="End")
-    app.faults_tree.heading("driver_begin", text="Driver Slot Begin")
-    app.faults_tree.heading("driver_end", text="Driver Slot End")
-    app.faults_tree.heading("codriver_begin", text="Codriver Slot Begin")
-    app.faults_tree.heading("codriver_end", text="Codriver Slot End")
-
-    app.faults_tree.column("type", width=220, anchor="w")
-    app.faults_tree.column("purpose", width=80, anchor="w")
-    app.faults_tree.column("begin", width=160, anchor="w")
-    app.faults_tree.column("end", width=160, anchor="w")
-    app.faults_tree.column("driver_begin", width=220, anchor="w")
-    app.faults_tree.column("driver_end", width=220, anchor="w")
-    app.faults_tree.column("codriver_begin", width=220, anchor="w")
-    app.faults_tree.column("codriver_end", width=220, anchor="w")
-
-    faults_scrollbar = ttk.Scrollbar(
-        faults_frame, orient="vertical", command=app.faults_tree.yview
-    )
-    app.faults_tree.configure(yscrollcommand=faults_scrollbar.set)
+    app.events_tree = _build_tree(events, _EVENTS_TREE, row=5, pady=(0, 12))
 
-    app.faults_tree.grid(row=0, column=0, sticky="nsew")
-    faults_scrollbar.grid(row=0, column=1, sticky="ns")
+    app.overspeed_tree = _build_tree(events, _OVERSPEED_TREE, row=7)
 
-    ttk.Label(events, text="Event data:").grid(
-        row=4, column=0, sticky="w", pady=(0, 6)
-    )
-
-    events_frame = ttk.Frame(events)
-    events_frame.grid(row=5, column=0, sticky="nsew", pady=(0, 12))
-    events_frame.columnconfigure(0, weight=1)
-    events_frame.rowconfigure(0, weight=1)
-
-    app.events_tree = ttk.Treeview(
-        events_frame,
-        columns=(
-            "type",
-            "purpose",
-            "begin",
-            "end",
-            "similar",
-            "driver_begin",
-            "driver_end",
-            "codriver_begin",
-            "codriver_end",
-        ),
-        show="headings",
-        height=8,
-    )
-    app.events_tree.heading("type", text="Event Type")
-    app.events_tree.heading("purpose", text="Purpose")
-    app.events_tree.heading("begin", text="Begin")
-    app.events_tree.heading("end", text="End")
-    app.events_tree.heading("similar", text="Similar Events")
-    app.events_tree.heading("driver_begin", text="Driver Slot Begin")
-    app.events_tree.heading("driver_end", text="Driver Slot End")
-    app.events_tree.heading("codriver_begin", text="Codriver Slot Begin")
-    app.events_tree.heading("codriver_end", text="Codriver Slot End")
-
-    app.events_tree.column("type", width=220, anchor="w")
-    app.events_tree.column("purpose", width=80, anchor="w")
-    app.events_tree.column("begin", width=160, anchor="w")
-    app.events_tree.column("end", width=160, anchor="w")
-    app.events_tree.column("similar", width=120, anchor="w")
-    app.events_tree.column("driver_begin", width=220, anchor="w")
-    app.events_tree.column("driver_end", width=220, anchor="w")
-    app.events_tree.column("codriver_begin", width=220, anchor="w")
-    app.events_tree.column("codriver_end", width=220, anchor="w")
-
-    events_scrollbar = ttk.Scrollbar(
-        events_frame, orient="vertical", command=app.events_tree.yview
-    )
-    app.events_tree.configure(yscrollcommand=events_scrollbar.set)
-
-    app.events_tree.grid(row=0, column=0, sticky="nsew")
-    events_scrollbar.grid(row=0, column=1, sticky="ns")
-
-    ttk.Label(events, text="Overspeeding event data:").grid(
-        row=6, column=0, sticky="w", pady=(0, 6)
-    )
-
-    overspeed_frame = ttk.Frame(events)
-    overspeed_frame.grid(row=7, column=0, sticky="nsew")
-    overspeed_frame.columnconfigure(0, weight=1)
-    overspeed_frame.rowconfigure(0, weight=1)
-
-    app.overspeed_tree = ttk.Treeview(
-        overspeed_frame,
-        columns=(
-            "type",
-            "begin",
-            "end",
-            "max_speed",
-            "avg_speed",
-            "similar",
-            "card_type",
-            "card_number",
-            "nation",
-        ),
-        show="headings",
-        height=8,
-    )
-    app.overspeed_tree.heading("type", text="Event Type")
-    app.overspeed_tree.heading("begin", text="Begin")
-    app.overspeed_tree.heading("end", text="End")
-    app.overspeed_tree.heading("max_speed", text="Max Speed")
-    app.overspeed_tree.heading("avg_speed", text="Avg Speed")
-    app.overspeed_tree.heading("similar", text="Similar Events")
-    app.overspeed_tree.heading("card_type", text="Card Type")
-    app.overspeed_tree.heading("card_number", text="Card Number")
-    app.overspeed_tree.heading("nation", text="Card Issuing State")
-
-    app.overspeed_tree.column("type", width=160, anchor="w")
-    app.overspeed_tree.column("begin", width=160, anchor="w")
-    app.overspeed_tree.column("end", width=160, anchor="w")
-    app.overspeed_tree.column("max_speed", width=90, anchor="w")
-    app.overspeed_tree.column("avg_speed", width=90, anchor="w")
-    app.overspeed_tree.column("similar", width=120, anchor="w")
-    app.overspeed_tree.column("card_type", width=140, anchor="w")
-    app.overspeed_tree.column("card_number", width=160, anchor="w")
-    app.overspeed_tree.column("nation", width=140, anchor="w")
-
-    overspeed_scrollbar = ttk.Scrollbar(
-        overspeed_frame, orient="vertical", command=app.overspeed_tree.yview
-    )
-    app.overspeed_tree.configure(yscrollcommand=overspeed_scrollbar.set)
-
-    app.overspeed_tree.grid(row=0, column=0, sticky="nsew")
-    overspeed_scrollbar.grid(row=0, column=1, sticky="ns")
 
+def _build_vu_activities_tab(app, activities_tab: ttk.Frame) -> None:
     activities = ttk.Frame(activities_tab, padding=12)
     activities.grid(row=0, column=0, sticky="nsew")
-    activities_tab.columnconfigure(0, weight=1)
-    activities_tab.rowconfigure(0, weight=1)
+    _stretch(activities_tab)
     activities.columnconfigure(0, weight=1)
     activities.rowconfigure(1, weight=2)
     activities.rowconfigure(3, weight=0)
-    activities.rowconfigure(4, weight=1)
-    activities.rowconfigure(6, weight=1)
+    activities.rowconfigure((4, 6), weight=1)
 
-    ttk.Label(activities, text="Activity header:").grid(
-        row=0, column=0, sticky="w", pady=(0, 6)
-    )
+    _add_labels(activities, _VU_ACTIVITIES_LABELS)
 
-    activity_header_frame = ttk.Frame(activities)
-    activity_header_frame.grid(row=1, column=0, sticky="nsew", pady=(0, 12))
-    activity_header_frame.columnconfigure(0, weight=1)
-    activity_header_frame.rowconfigure(0, weight=1)
-
-    app.activity_header_tree = ttk.Treeview(
-        activity_header_frame,
-        columns=(
-            "date",
-            "slot",
-            "name",
-            "card_number",
-            "expiry",
-            "insertion",
-            "withdrawal",
-            "odo_in",
-            "odo_out",
-            "prev_vehicle",
-            "prev_withdrawal",
-        ),
-        show="headings",
-        height=6,
-    )
-    app.activity_header_tree.heading("date", text="Date")
-    app.activity_header_tree.heading("slot", text="Slot")
-    app.activity_header_tree.heading("name", text="Name")
-    app.activity_header_tree.heading("card_number", text="Card Number")
-    app.activity_header_tree.heading("expiry", text="Card Expiry")
-    app.activity_header_tree.heading("insertion", text="Insertion Time")
-    app.activity_header_tree.heading("withdrawal", text="Withdrawal Time")
-    app.activity_header_tree.heading("odo_in", text="Odometer In")
-    app.activity_header_tree.heading("odo_out", text="Odometer Out")
-    app.activity_header_tree.heading("prev_vehicle", text="Previous Vehicle")
-    app.activity_header_tree.heading("prev_withdrawal", text="Prev Withdrawal")
-
-    app.activity_header_tree.column("date", width=140, anchor="w")
-    app.activity_header_tree.column("slot", width=80, anchor="w")
-    app.activity_header_tree.column("name", width=180, anchor="w")
-    app.activity_header_tree.column("card_number", width=160, anchor="w")
-    app.activity_header_tree.column("expiry", width=130, anchor="w")
-    app.activity_header_tree.column("insertion", width=140, anchor="w")
-    app.activity_header_tree.column("withdrawal", width=140, anchor="w")
-    app.activity_header_tree.column("odo_in", width=100, anchor="w")
-    app.activity_header_tree.column("odo_out", width=100, anchor="w")
-    app.activity_header_tree.column("prev_vehicle", width=180, anchor="w")
-    app.activity_header_tree.column("prev_withdrawal", width=140, anchor="w")
-
-    activity_header_scrollbar = ttk.Scrollbar(
-        activity_header_frame,
-        orient="vertical",
-        command=app.activity_header_tree.yview,
-    )
-    app.activity_header_tree.configure(
-        yscrollcommand=activity_header_scrollbar.set
+    app.activity_header_tree = _build_tree(
+        activities, _ACTIVITY_HEADER_TREE, row=1, pady=(0, 12)
     )
-
-    app.activity_header_tree.grid(row=0, column=0, sticky="nsew")
-    activity_header_scrollbar.grid(row=0, column=1, sticky="ns")
     app.activity_header_tree.bind("<<TreeviewSelect>>", app._on_activity_header_selected)
 
     chart_header = ttk.Frame(activities)
-    chart_header.grid(row=2, column=0, sticky="ew", pady=(0, 2))
+    chart_header.grid(row=2, column=0, columnspan=2, sticky="ew", pady=(0, 2))
     chart_header.columnconfigure(1, weight=1)
 
     ttk.Label(chart_header, text="Activities (chart):").grid(
@@ -709,7 +585,7 @@ def build_vehicle_unit_tab(app, parent: ttk.Frame) -> None:
     )
     ttk.Label(chart_header, text="Day:").grid(row=0, column=2, sticky="e")
 
-    app.activity_day_combo = ttk.Combobox(
+    app.activity_day_combo = LazyCombobox(
         chart_header,
         textvariable=app.activity_day_var,
         state="readonly",
@@ -728,9 +604,8 @@ def build_vehicle_unit_tab(app, parent: ttk.Frame) -> None:
     app._add_legend_item(legend, "Unknown", "#E00000", 4)
 
     chart_frame = ttk.Frame(activities)
-    chart_frame.grid(row=4, column=0, sticky="nsew", pady=(0, 6))
-    chart_frame.columnconfigure(0, weight=1)
-    chart_frame.rowconfigure(0, weight=1)
+    chart_frame.grid(row=4, column=0, columnspan=2, sticky="nsew", pady=(0, 6))
+    _stretch(chart_frame)
 
     app.activity_canvas = tk.Canvas(chart_frame, height=280, bg="white")
     app.activity_canvas.grid(row=0, column=0, sticky="nsew")
@@ -745,399 +620,388 @@ def build_vehicle_unit_tab(app, parent: ttk.Frame) -> None:
 
     chart_scrollbar.grid(row=0, column=1, sticky="ns")
 
-    ttk.Label(activities, text="Activities (timeline):").grid(
-        row=5, column=0, sticky="w", pady=(0, 6)
-    )
+    app.activities_tree = _build_tree(activities, _ACTIVITIES_TREE, row=6)
 
-    activities_frame = ttk.Frame(activities)
-    activities_frame.grid(row=6, column=0, sticky="nsew")
-    activities_frame.columnconfigure(0, weight=1)
-    activities_frame.rowconfigure(0, weight=1)
-
-    app.activities_tree = ttk.Treeview(
-        activities_frame,
-        columns=(
-            "date",
-            "slot",
-            "start",
-            "end",
-            "activity",
-            "card_status",
-            "driving_status",
-            "odometer",
-        ),
-        show="headings",
-        height=6,
-    )
-    app.activities_tree.heading("date", text="Date")
-    app.activities_tree.heading("slot", text="Slot")
-    app.activities_tree.heading("start", text="Start")
-    app.activities_tree.heading("end", text="End")
-    app.activities_tree.heading("activity", text="Activity")
-    app.activities_tree.heading("card_status", text="Card Status")
-    app.activities_tree.heading("driving_status", text="Driving Status")
-    app.activities_tree.heading("odometer", text="Odometer @ Midnight")
-
-    app.activities_tree.column("date", width=140, anchor="w")
-    app.activities_tree.column("slot", width=80, anchor="w")
-    app.activities_tree.column("start", width=70, anchor="w")
-    app.activities_tree.column("end", width=70, anchor="w")
-    app.activities_tree.column("activity", width=120, anchor="w")
-    app.activities_tree.column("card_status", width=120, anchor="w")
-    app.activities_tree.column("driving_status", width=120, anchor="w")
-    app.activities_tree.column("odometer", width=140, anchor="w")
-
-    activities_scrollbar = ttk.Scrollbar(
-        activities_frame, orient="vertical", command=app.activities_tree.yview
-    )
-    app.activities_tree.configure(yscrollcommand=activities_scrollbar.set)
 
-    app.activities_tree.grid(row=0, column=0, sticky="nsew")
-    activities_scrollbar.grid(row=0, column=1, sticky="ns")
+def _build_card_identification_tab(app, card_ident_tab: ttk.Frame) -> None:
+    _stretch(card_ident_tab, rows=(1, 3, 5))
 
+    _add_labels(card_ident_tab, _CARD_IDENTIFICATION_LABELS)
 
-def build_driver_card_tab(app, parent: ttk.Frame) -> None:
-    driver_card = ttk.Notebook(parent)
-    driver_card.grid(row=0, column=0, sticky="nsew")
-    parent.columnconfigure(0, weight=1)
-    parent.rowconfigure(0, weight=1)
-
-    card_ident_tab = ttk.Frame(driver_card)
-    card_events_tab = ttk.Frame(driver_card)
-    card_vehicles_tab = ttk.Frame(driver_card)
-    card_places_tab = ttk.Frame(driver_card)
-    card_conditions_tab = ttk.Frame(driver_card)
-    card_units_tab = ttk.Frame(driver_card)
-    driver_card.add(card_ident_tab, text="Identification")
-    driver_card.add(card_events_tab, text="Events")
-    driver_card.add(card_vehicles_tab, text="Vehicles")
-    driver_card.add(card_places_tab, text="Places")
-    driver_card.add(card_conditions_tab, text="Conditions")
-    driver_card.add(card_units_tab, text="Vehicle Units")
-
-    card_ident_tab.columnconfigure(0, weight=1)
-    card_ident_tab.rowconfigure(1, weight=1)
-    card_ident_tab.rowconfigure(3, weight=1)
-    card_ident_tab.rowconfigure(5, weight=1)
-
-    ttk.Label(card_ident_tab, text="Card application identification:").grid(
-        row=0, column=0, sticky="w", pady=(0, 6)
-    )
+    app.card_app_tree = _build_tree(card_ident_tab, _CARD_APP_TREE, row=1, pady=(0, 12))
 
-    card_app_frame = ttk.Frame(card_ident_tab)
-    card_app_frame.grid(row=1, column=0, sticky="nsew", pady=(0, 12))
-    card_app_frame.columnconfigure(0, weight=1)
-    card_app_frame.rowconfigure(0, weight=1)
+    app.card_licence_tree = _build_tree(card_ident_tab, _CARD_LICENCE_TREE, row=3, pady=(0, 12))
 
-    app.card_app_tree = ttk.Treeview(
-        card_app_frame, columns=("value",), show="tree headings", height=6
-    )
-    app.card_app_tree.heading("#0", text="Field")
-    app.card_app_tree.heading("value", text="Value")
-    app.card_app_tree.column("#0", width=260, anchor="w")
-    app.card_app_tree.column("value", anchor="w")
+    app.card_ident_tree = _build_tree(card_ident_tab, _CARD_IDENT_TREE, row=5)
 
-    card_app_scrollbar = ttk.Scrollbar(
-        card_app_frame, orient="vertical", command=app.card_app_tree.yview
-    )
-    app.card_app_tree.configure(yscrollcommand=card_app_scrollbar.set)
 
-    app.card_app_tree.grid(row=0, column=0, sticky="nsew")
-    card_app_scrollbar.grid(row=0, column=1, sticky="ns")
+def _build_card_events_tab(app, card_events_tab: ttk.Frame) -> None:
+    _stretch(card_events_tab, rows=(1, 3))
 
-    ttk.Label(card_ident_tab, text="Driving licence information:").grid(
-        row=2, column=0, sticky="w", pady=(0, 6)
-    )
+    _add_labels(card_events_tab, _CARD_EVENTS_LABELS)
 
-    card_licence_frame = ttk.Frame(card_ident_tab)
-    card_licence_frame.grid(row=3, column=0, sticky="nsew", pady=(0, 12))
-    card_licence_frame.columnconfigure(0, weight=1)
-    card_licence_frame.rowconfigure(0, weight=1)
+    app.card_events_tree = _build_tree(card_events_tab, _CARD_EVENTS_TREE, row=1, pady=(0, 12))
 
-    app.card_licence_tree = ttk.Treeview(
-        card_licence_frame, columns=("value",), show="tree headings", height=4
-    )
-    app.card_licence_tree.heading("#0", text="Field")
-    app.card_licence_tree.heading("value", text="Value")
-    app.card_licence_tree.column("#0", width=260, anchor="w")
-    app.card_licence_tree.column("value", anchor="w")
+    app.card_faults_tree = _build_tree(card_events_tab, _CARD_FAULTS_TREE, row=3)
 
-    card_licence_scrollbar = ttk.Scrollbar(
-        card_licence_frame, orient="vertical", command=app.card_licence_tree.yview
-    )
-    app.card_licence_tree.configure(yscrollcommand=card_licence_scrollbar.set)
 
-    app.card_licence_tree.grid(row=0, column=0, sticky="nsew")
-    card_licence_scrollbar.grid(row=0, column=1, sticky="ns")
+def _build_card_vehicles_tab(app, card_vehicles_tab: ttk.Frame) -> None:
+    _stretch(card_vehicles_tab, rows=1)
 
-    ttk.Label(card_ident_tab, text="Card identification:").grid(
-        row=4, column=0, sticky="w", pady=(0, 6)
-    )
+    _add_labels(card_vehicles_tab, _CARD_VEHICLES_LABELS)
 
-    card_ident_frame = ttk.Frame(card_ident_tab)
-    card_ident_frame.grid(row=5, column=0, sticky="nsew")
-    card_ident_frame.columnconfigure(0, weight=1)
-    card_ident_frame.rowconfigure(0, weight=1)
+    app.card_vehicles_tree = _build_tree(card_vehicles_tab, _CARD_VEHICLES_TREE, row=1)
 
-    app.card_ident_tree = ttk.Treeview(
-        card_ident_frame, columns=("value",), show="tree headings", height=8
-    )
-    app.card_ident_tree.heading("#0", text="Field")
-    app.card_ident_tree.heading("value", text="Value")
-    app.card_ident_tree.column("#0", width=260, anchor="w")
-    app.card_ident_tree.column("value", anchor="w")
 
-    card_ident_scrollbar = ttk.Scrollbar(
-        card_ident_frame, orient="vertical", command=app.card_ident_tree.yview
-    )
-    app.card_ident_tree.configure(yscrollcommand=card_ident_scrollbar.set)
+def _build_card_places_tab(app, card_places_tab: ttk.Frame) -> None:
+    _stretch(card_places_tab, rows=1)
 
-    app.card_ident_tree.grid(row=0, column=0, sticky="nsew")
-    card_ident_scrollbar.grid(row=0, column=1, sticky="ns")
+    _add_labels(card_places_tab, _CARD_PLACES_LABELS)
 
-    card_events_tab.columnconfigure(0, weight=1)
-    card_events_tab.rowconfigure(1, weight=1)
-    card_events_tab.rowconfigure(3, weight=1)
+    app.card_places_tree = _build_tree(card_places_tab, _CARD_PLACES_TREE, row=1)
 
-    ttk.Label(card_events_tab, text="Event data:").grid(
-        row=0, column=0, sticky="w", pady=(0, 6)
-    )
 
-    card_events_frame = ttk.Frame(card_events_tab)
-    card_events_frame.grid(row=1, column=0, sticky="nsew", pady=(0, 12))
-    card_events_frame.columnconfigure(0, weight=1)
-    card_events_frame.rowconfigure(0, weight=1)
+def _build_card_conditions_tab(app, card_conditions_tab: ttk.Frame) -> None:
+    _stretch(card_conditions_tab, rows=1)
 
-    app.card_events_tree = ttk.Treeview(
-        card_events_frame,
-        columns=("type", "begin", "end", "nation", "registration"),
-        show="headings",
-        height=10,
-    )
-    app.card_events_tree.heading("type", text="Type")
-    app.card_events_tree.heading("begin", text="Begin")
-    app.card_events_tree.heading("end", text="End")
-    app.card_events_tree.heading("nation", text="Registration Nation")
-    app.card_events_tree.heading("registration", text="Registration Number")
-
-    app.card_events_tree.column("type", width=240, anchor="w")
-    app.card_events_tree.column("begin", width=160, anchor="w")
-    app.card_events_tree.column("end", width=160, anchor="w")
-    app.card_events_tree.column("nation", width=140, anchor="w")
-    app.card_events_tree.column("registration", width=160, anchor="w")
-
-    card_events_scrollbar = ttk.Scrollbar(
-        card_events_frame, orient="vertical", command=app.card_events_tree.yview
-    )
-    app.card_events_tree.configure(yscrollcommand=card_events_scrollbar.set)
+    _add_labels(card_conditions_tab, _CARD_CONDITIONS_LABELS)
 
-    app.card_events_tree.grid(row=0, column=0, sticky="nsew")
-    card_events_scrollbar.grid(row=0, column=1, sticky="ns")
+    app.card_conditions_tree = _build_tree(card_conditions_tab, _CARD_CONDITIONS_TREE, row=1)
 
-    ttk.Label(card_events_tab, text="Fault data:").grid(
-        row=2, column=0, sticky="w", pady=(0, 6)
-    )
 
-    card_faults_frame = ttk.Frame(card_events_tab)
-    card_faults_frame.grid(row=3, column=0, sticky="nsew")
-    card_faults_frame.columnconfigure(0, weight=1)
-    card_faults_frame.rowconfigure(0, weight=1)
+def _build_card_units_tab(app, card_units_tab: ttk.Frame) -> None:
+    _stretch(card_units_tab, rows=1)
 
-    app.card_faults_tree = ttk.Treeview(
-        card_faults_frame,
-        columns=("type", "begin", "end", "nation", "registration"),
-        show="headings",
-        height=6,
-    )
-    app.card_faults_tree.heading("type", text="Type")
-    app.card_faults_tree.heading("begin", text="Begin")
-    app.card_faults_tree.heading("end", text="End")
-    app.card_faults_tree.heading("nation", text="Registration Nation")
-    app.card_faults_tree.heading("registration", text="Registration Number")
-
-    app.card_faults_tree.column("type", width=240, anchor="w")
-    app.card_faults_tree.column("begin", width=160, anchor="w")
-    app.card_faults_tree.column("end", width=160, anchor="w")
-    app.card_faults_tree.column("nation", width=140, anchor="w")
-    app.card_faults_tree.column("registration", width=160, anchor="w")
-
-    card_faults_scrollbar = ttk.Scrollbar(
-        card_faults_frame, orient="vertical", command=app.card_faults_tree.yview
-    )
-    app.card_faults_tree.configure(yscrollcommand=card_faults_scrollbar.set)
-
-    app.card_faults_tree.grid(row=0, column=0, sticky="nsew")
-    card_faults_scrollbar.grid(row=0, column=1, sticky="ns")
+    _add_labels(card_units_tab, _CARD_UNITS_LABELS)
 
-    card_vehicles_tab.columnconfigure(0, weight=1)
-    card_vehicles_tab.rowconfigure(1, weight=1)
-
-    ttk.Label(card_vehicles_tab, text="Vehicles used:").grid(
-        row=0, column=0, sticky="w", pady=(0, 6)
-    )
-
-    card_vehicles_frame = ttk.Frame(card_vehicles_tab)
-    card_vehicles_frame.grid(row=1, column=0, sticky="nsew")
-    card_vehicles_frame.columnconfigure(0, weight=1)
-    card_vehicles_frame.rowconfigure(0, weight=1)
-
-    app.card_vehicles_tree = ttk.Treeview(
-        card_vehicles_frame,
-        columns=(
-            "first_use",
-            "last_use",
-            "odo_begin",
-            "odo_end",
-            "nation",
-            "registration",
-            "vin",
-        ),
-        show="headings",
-        height=10,
-    )
-    app.card_vehicles_tree.heading("first_use", text="First Use")
-    app.card_vehicles_tree.heading("last_use", text="Last Use")
-    app.card_vehicles_tree.heading("odo_begin", text="Odometer Begin")
-    app.card_vehicles_tree.heading("odo_end", text="Odometer End")
-    app.card_vehicles_tree.heading("nation", text="Registration Nation")
-    app.card_vehicles_tree.heading("registration", text="Registration Number")
-    app.card_vehicles_tree.heading("vin", text="VIN")
-
-    app.card_vehicles_tree.column("first_use", width=160, anchor="w")
-    app.card_vehicles_tree.column("last_use", width=160, anchor="w")
-    app.card_vehicles_tree.column("odo_begin", width=120, anchor="w")
-    app.card_vehicles_tree.column("odo_end", width=120, anchor="w")
-    app.card_vehicles_tree.column("nation", width=140, anchor="w")
-    app.card_vehicles_tree.column("registration", width=160, anchor="w")
-    app.card_vehicles_tree.column("vin", width=180, anchor="w")
-
-    card_vehicles_scrollbar = ttk.Scrollbar(
-        card_vehicles_frame, orient="vertical", command=app.card_vehicles_tree.yview
-    )
-    app.card_vehicles_tree.configure(yscrollcommand=card_vehicles_scrollbar.set)
-
-    app.card_vehicles_tree.grid(row=0, column=0, sticky="nsew")
-    card_vehicles_scrollbar.grid(row=0, column=1, sticky="ns")
-
-    card_places_tab.columnconfigure(0, weight=1)
-    card_places_tab.rowconfigure(1, weight=1)
-
-    ttk.Label(card_places_tab, text="Places:").grid(
-        row=0, column=0, sticky="w", pady=(0, 6)
-    )
-
-    card_places_frame = ttk.Frame(card_places_tab)
-    card_places_frame.grid(row=1, column=0, sticky="nsew")
-    card_places_frame.columnconfigure(0, weight=1)
-    card_places_frame.rowconfigure(0, weight=1)
-
-    app.card_places_tree = ttk.Treeview(
-        card_places_frame,
-        columns=(
-            "time",
-            "country",
-            "region",
-            "odometer",
-            "entry",
-            "gps_time",
-            "accuracy",
-            "latitude",
-            "longitude",
-        ),
-        show="headings",
-        height=10,
-    )
-    app.card_places_tree.heading("time", text="Time")
-    app.card_places_tree.heading("country", text="Country")
-    app.card_places_tree.heading("region", text="Region")
-    app.card_places_tree.heading("odometer", text="Odometer")
-    app.card_places_tree.heading("entry", text="Entry Type")
-    app.card_places_tree.heading("gps_time", text="GPS Time")
-    app.card_places_tree.heading("accuracy", text="Accuracy")
-    app.card_places_tree.heading("latitude", text="Latitude")
-    app.card_places_tree.heading("longitude", text="Longitude")
-
-    app.card_places_tree.column("time", width=160, anchor="w")
-    app.card_places_tree.column("country", width=100, anchor="w")
-    app.card_places_tree.column("region", width=80, anchor="w")
-    app.card_places_tree.column("odometer", width=120, anchor="w")
-    app.card_places_tree.column("entry", width=220, anchor="w")
-    app.card_places_tree.column("gps_time", width=160, anchor="w")
-    app.card_places_tree.column("accuracy", width=90, anchor="w")
-    app.card_places_tree.column("latitude", width=120, anchor="w")
-    app.card_places_tree.column("longitude", width=120, anchor="w")
-
-    card_places_scrollbar = ttk.Scrollbar(
-        card_places_frame, orient="vertical", command=app.card_places_tree.yview
-    )
-    app.card_places_tree.configure(yscrollcommand=card_places_scrollbar.set)
+    app.card_units_tree = _build_tree(card_units_tab, _CARD_UNITS_TREE, row=1)
 
-    app.card_places_tree.grid(row=0, column=0, sticky="nsew")
-    card_places_scrollbar.grid(row=0, column=1, sticky="ns")
-
-    card_conditions_tab.columnconfigure(0, weight=1)
-    card_conditions_tab.rowconfigure(1, weight=1)
-
-    ttk.Label(card_conditions_tab, text="Specific conditions:").grid(
-        row=0, column=0, sticky="w", pady=(0, 6)
-    )
-
-    card_conditions_frame = ttk.Frame(card_conditions_tab)
-    card_conditions_frame.grid(row=1, column=0, sticky="nsew")
-    card_conditions_frame.columnconfigure(0, weight=1)
-    card_conditions_frame.rowconfigure(0, weight=1)
-
-    app.card_conditions_tree = ttk.Treeview(
-        card_conditions_frame,
-        columns=("time", "type"),
-        show="headings",
-        height=8,
-    )
-    app.card_conditions_tree.heading("time", text="Time")
-    app.card_conditions_tree.heading("type", text="Type")
-    app.card_conditions_tree.column("time", width=200, anchor="w")
-    app.card_conditions_tree.column("type", width=220, anchor="w")
-
-    card_conditions_scrollbar = ttk.Scrollbar(
-        card_conditions_frame, orient="vertical", command=app.card_conditions_tree.yview
-    )
-    app.card_conditions_tree.configure(yscrollcommand=card_conditions_scrollbar.set)
-
-    app.card_conditions_tree.grid(row=0, column=0, sticky="nsew")
-    card_conditions_scrollbar.grid(row=0, column=1, sticky="ns")
-
-    card_units_tab.columnconfigure(0, weight=1)
-    card_units_tab.rowconfigure(1, weight=1)
-
-    ttk.Label(card_units_tab, text="Vehicle units:").grid(
-        row=0, column=0, sticky="w", pady=(0, 6)
-    )
-
-    card_units_frame = ttk.Frame(card_units_tab)
-    card_units_frame.grid(row=1, column=0, sticky="nsew")
-    card_units_frame.columnconfigure(0, weight=1)
-    card_units_frame.rowconfigure(0, weight=1)
-
-    app.card_units_tree = ttk.Treeview(
-        card_units_frame,
-        columns=("time", "manufacturer", "device", "software"),
-        show="headings",
-        height=6,
-    )
-    app.card_units_tree.heading("time", text="Timestamp")
-    app.card_units_tree.heading("manufacturer", text="Manufacturer Code")
-    app.card_units_tree.heading("device", text="Device ID")
-    app.card_units_tree.heading("software", text="Software Version")
-
-    app.card_units_tree.column("time", width=180, anchor="w")
-    app.card_units_tree.column("manufacturer", width=160, anchor="w")
-    app.card_units_tree.column("device", width=120, anchor="w")
-    app.card_units_tree.column("software", width=140, anchor="w")
-
-    card_units_scrollbar = ttk.Scrollbar(
-        card_units_frame, orient="vertical", command=app.card_units_tree.yview
-    )
-    app.card_units_tree.configure(yscrollcommand=card_units_scrollbar.set)
 
-    app.card_units_tree.grid(row=0, column=0, sticky="nsew")
-    card_units_scrollbar.grid(row=0, column=1, sticky="ns")
+_HEADER_TREE = _TreeSpec(
+    (
+        ("#0", "Field", 200),
+        ("value", "Value", None),
+    ),
+    height=7,
+)
+
+_PARTS_TREE = _TreeSpec(
+    (
+        ("part", "Part", 200),
+        ("status", "Status", 120),
+        ("note", "Note", None),
+    ),
+    height=6,
+)
+
+_IDENT_TREE = _TreeSpec(
+    (
+        ("#0", "Field", 220),
+        ("value", "Value", None),
+    ),
+    height=7,
+)
+
+_OVERVIEW_TREE = _TreeSpec(
+    (
+        ("#0", "Field", 260),
+        ("value", "Value", None),
+    ),
+    height=10,
+)
+
+_COMPANY_LOCKS_TREE = _TreeSpec(
+    (
+        ("start", "Start", 160),
+        ("end", "End", 160),
+        ("name", "Company Name", 180),
+        ("address", "Company Address", 220),
+        ("card", "Card Number", 160),
+    ),
+    height=6,
+)
+
+_CONTROL_TREE = _TreeSpec(
+    (
+        ("type", "Type", 200),
+        ("time", "Time", 160),
+        ("card_type", "Card Type", 140),
+        ("nation", "Card Issuing Member State", 120),
+        ("card_number", "Card Number", 160),
+        ("generation", "Card Generation", 110),
+        ("begin", "Begin Period", 160),
+        ("end", "End Period", 160),
+    ),
+    height=7,
+)
+
+_TECH_IDENT_TREE = _TreeSpec(
+    (
+        ("#0", "Field", 220),
+        ("value", "Value", None),
+    ),
+    height=7,
+)
+
+_SENSOR_TREE = _TreeSpec(
+    (
+        ("#0", "Field", 220),
+        ("value", "Value", None),
+    ),
+    height=4,
+)
+
+_CALIBRATION_TREE = _TreeSpec(
+    (
+        ("purpose", "Purpose", 140),
+        ("workshop", "Workshop Name", 180),
+        ("address", "Workshop Address", 220),
+        ("card", "Workshop Card", 180),
+        ("expiry", "Card Expiry", 160),
+        ("vin", "VIN", 180),
+        ("registration", "Registration", 160),
+        ("vehicle_constant", "Vehicle Constant", 130),
+        ("recording_constant", "Recording Constant", 150),
+    ),
+    height=7,
+)
+
+_FAULTS_TREE = _TreeSpec(
+    (
+        ("type", "Fault Type", 220),
+        ("purpose", "Purpose", 80),
+        ("begin", "Begin", 160),
+        ("end", "End", 160),
+        ("driver_begin", "Driver Slot Begin", 220),
+        ("driver_end", "Driver Slot End", 220),
+        ("codriver_begin", "Codriver Slot Begin", 220),
+        ("codriver_end", "Codriver Slot End", 220),
+    ),
+    height=6,
+    virtual=True,
+)
+
+_EVENTS_TREE = _TreeSpec(
+    (
+        ("type", "Event Type", 220),
+        ("purpose", "Purpose", 80),
+        ("begin", "Begin", 160),
+        ("end", "End", 160),
+        ("similar", "Similar Events", 120),
+        ("driver_begin", "Driver Slot Begin", 220),
+        ("driver_end", "Driver Slot End", 220),
+        ("codriver_begin", "Codriver Slot Begin", 220),
+        ("codriver_end", "Codriver Slot End", 220),
+    ),
+    height=8,
+    virtual=True,
+)
+
+_OVERSPEED_TREE = _TreeSpec(
+    (
+        ("type", "Event Type", 160),
+        ("begin", "Begin", 160),
+        ("end", "End", 160),
+        ("max_speed", "Max Speed", 90),
+        ("avg_speed", "Avg Speed", 90),
+        ("similar", "Similar Events", 120),
+        ("card_type", "Card Type", 140),
+        ("card_number", "Card Number", 160),
+        ("nation", "Card Issuing State", 140),
+    ),
+    height=8,
+    virtual=True,
+)
+
+_ACTIVITY_HEADER_TREE = _TreeSpec(
+    (
+        ("date", "Date", 140),
+        ("slot", "Slot", 80),
+        ("name", "Name", 180),
+        ("card_number", "Card Number", 160),
+        ("expiry", "Card Expiry", 130),
+        ("insertion", "Insertion Time", 140),
+        ("withdrawal", "Withdrawal Time", 140),
+        ("odo_in", "Odometer In", 100),
+        ("odo_out", "Odometer Out", 100),
+        ("prev_vehicle", "Previous Vehicle", 180),
+        ("prev_withdrawal", "Prev Withdrawal", 140),
+    ),
+    height=6,
+)
+
+_ACTIVITIES_TREE = _TreeSpec(
+    (
+        ("date", "Date", 140),
+        ("slot", "Slot", 80),
+        ("start", "Start", 70),
+        ("end", "End", 70),
+        ("activity", "Activity", 120),
+        ("card_status", "Card Status", 120),
+        ("driving_status", "Driving Status", 120),
+        ("odometer", "Odometer @ Midnight", 140),
+    ),
+    height=6,
+    virtual=True,
+)
+
+_CARD_APP_TREE = _TreeSpec(
+    (
+        ("#0", "Field", 260),
+        ("value", "Value", None),
+    ),
+    height=6,
+)
+
+_CARD_LICENCE_TREE = _TreeSpec(
+    (
+        ("#0", "Field", 260),
+        ("value", "Value", None),
+    ),
+    height=4,
+)
+
+_CARD_IDENT_TREE = _TreeSpec(
+    (
+        ("#0", "Field", 260),
+        ("value", "Value", None),
+    ),
+    height=8,
+)
+
+_CARD_EVENTS_TREE = _TreeSpec(
+    (
+        ("type", "Type", 240),
+        ("begin", "Begin", 160),
+        ("end", "End", 160),
+        ("nation", "Registration Nation", 140),
+        ("registration", "Registration Number", 160),
+    ),
+    height=10,
+)
+
+_CARD_FAULTS_TREE = _TreeSpec(
+    (
+        ("type", "Type", 240),
+        ("begin", "Begin", 160),
+        ("end", "End", 160),
+        ("nation", "Registration Nation", 140),
+        ("registration", "Registration Number", 160),
+    ),
+    height=6,
+)
+
+_CARD_VEHICLES_TREE = _TreeSpec(
+    (
+        ("first_use", "First Use", 160),
+        ("last_use", "Last Use", 160),
+        ("odo_begin", "Odometer Begin", 120),
+        ("odo_end", "Odometer End", 120),
+        ("nation", "Registration Nation", 140),
+        ("registration", "Registration Number", 160),
+        ("vin", "VIN", 180),
+    ),
+    height=10,
+)
+
+_CARD_PLACES_TREE = _TreeSpec(
+    (
+        ("time", "Time", 160),
+        ("country", "Country", 100),
+        ("region", "Region", 80),
+        ("odometer", "Odometer", 120),
+        ("entry", "Entry Type", 220),
+        ("gps_time", "GPS Time", 160),
+        ("accuracy", "Accuracy", 90),
+        ("latitude", "Latitude", 120),
+        ("longitude", "Longitude", 120),
+    ),
+    height=10,
+    virtual=True,
+)
+
+_CARD_CONDITIONS_TREE = _TreeSpec(
+    (
+        ("time", "Time", 200),
+        ("type", "Type", 220),
+    ),
+    height=8,
+)
+
+_CARD_UNITS_TREE = _TreeSpec(
+    (
+        ("time", "Timestamp", 180),
+        ("manufacturer", "Manufacturer Code", 160),
+        ("device", "Device ID", 120),
+        ("software", "Software Version", 140),
+    ),
+    height=6,
+)
+
+_PART_STATUS_COLOURS = (
+    ("valid", "#1B5E20"),
+    ("invalid", "#B71C1C"),
+    ("missing", "#6B6B6B"),
+    ("not_applicable", "#6B6B6B"),
+)
+
+_SUMMARY_LABELS = (
+    (1, "Select a tachograph .ddd file to open:", (10, 0)),
+    (4, "Parsed header fields:", (12, 0)),
+    (6, "File parts:", (12, 0)),
+)
+
+_VU_IDENTIFICATION_LABELS = (
+    (0, "VU identification (heuristic):", (0, 6)),
+)
+
+_VU_REPORT_LABELS = (
+    (0, "Overview:", (0, 6)),
+    (2, "Company locks:", (0, 6)),
+    (4, "Control activities:", (0, 6)),
+)
+
+_VU_TECHNICAL_LABELS = (
+    (0, "Technical identification:", (0, 6)),
+    (2, "Sensor pairing:", (0, 6)),
+    (4, "Calibration records:", (0, 6)),
+)
+
+_VU_EVENTS_LABELS = (
+    (0, "Overspeed control:", (0, 6)),
+    (2, "Fault data:", (0, 6)),
+    (4, "Event data:", (0, 6)),
+    (6, "Overspeeding event data:", (0, 6)),
+)
+
+_VU_ACTIVITIES_LABELS = (
+    (0, "Activity header:", (0, 6)),
+    (5, "Activities (timeline):", (0, 6)),
+)
+
+_CARD_IDENTIFICATION_LABELS = (
+    (0, "Card application identification:", (0, 6)),
+    (2, "Driving licence information:", (0, 6)),
+    (4, "Card identification:", (0, 6)),
+)
+
+_CARD_EVENTS_LABELS = (
+    (0, "Event data:", (0, 6)),
+    (2, "Fault data:", (0, 6)),
+)
+
+_CARD_VEHICLES_LABELS = (
+    (0, "Vehicles used:", (0, 6)),
+)
+
+_CARD_PLACES_LABELS = (
+    (0, "Places:", (0, 6)),
+)
+
+_CARD_CONDITIONS_LABELS = (
+    (0, "Specific conditions:", (0, 6)),
+)
+
+_CARD_UNITS_LABELS = (
+    (0, "Vehicle units:", (0, 6)),
+)